@@ -0,0 +1,113 @@
+import argparse
+import gc
+import itertools
+import json
+import os
+import sys
+import time
+
+FILE_PATH = os.path.dirname(os.path.abspath(__file__))  # Windows friendly
+CACHING_PATH = os.path.join(FILE_PATH, '..', 'caching')
+DATA_DIR = os.path.join(FILE_PATH, '..', 'recursive_functions', 'swapi_data')
+COUNT = 100000
+
+sys.path.insert(0, os.path.abspath(CACHING_PATH))
+
+import swapi_solution
+
+# category: (per-record factory, bulk factory)
+FACTORIES = {
+    'planets': (swapi_solution.create_planet, swapi_solution.create_planets),
+    'species': (swapi_solution.create_species, swapi_solution.create_species_list),
+    'starships': (swapi_solution.create_starship, swapi_solution.create_starships)
+}
+
+
+def load_records(category, count):
+    """Read a swapi_< category >.json snapshot, keep the records that the per-record factory
+    can convert (it raises ValueError on placeholders such as 'unknown') and repeat them up to
+    < count > records.
+
+    Parameters:
+        category (str): SWAPI category
+        count (int): number of records to return
+
+    Returns:
+        tuple: (records, number of snapshot records kept, number of snapshot records)
+    """
+
+    with open(os.path.join(DATA_DIR, f"swapi_{category}.json"), 'r', encoding='utf-8') as file_obj:
+        snapshot = json.load(file_obj)
+
+    create = FACTORIES[category][0]
+    convertible = []
+    for record in snapshot:
+        try:
+            create(record)
+        except ValueError:
+            continue
+        convertible.append(record)
+
+    records = list(itertools.islice(itertools.cycle(convertible), count))
+
+    return records, len(convertible), len(snapshot)
+
+
+def main():
+    """Entry point. Times the per-record < create_* > factories against the schema-compiled
+    bulk factories on whole SWAPI categories and checks that both produce the same entities.
+    Usage:
+
+        python bulk_factories.py
+        python bulk_factories.py starships --count 1000000 --repeat 5
+    """
+
+    parser = argparse.ArgumentParser(description='Benchmark per-record vs bulk entity factories')
+    parser.add_argument(
+        'categories', nargs='*', help=f"any of {', '.join(FACTORIES)} (default: all)"
+        )
+    parser.add_argument('--count', type=int, default=COUNT, help='records per category')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per factory (best kept)')
+    args = parser.parse_args()
+
+    categories = args.categories or list(FACTORIES)
+    for category in categories:
+        if category not in FACTORIES:
+            parser.error(f"unknown category: {category}")
+
+    print(f"{'category':<12}{'records':>10}{'per-record':>12}{'bulk':>10}{'speedup':>9}")
+    for category in categories:
+        create, create_many = FACTORIES[category]
+        records, kept, total = load_records(category, args.count)
+
+        per_record = bulk = None
+        for _ in range(args.repeat):
+            single = many = None
+            gc.collect()
+            gc.disable() # as timeit does; collections would scan the other run's entities
+            try:
+                start = time.perf_counter()
+                single = [create(record) for record in records]
+                elapsed = time.perf_counter() - start
+                per_record = elapsed if per_record is None else min(per_record, elapsed)
+
+                single = single[:kept]
+                gc.collect()
+
+                start = time.perf_counter()
+                many = create_many(records)
+                elapsed = time.perf_counter() - start
+                bulk = elapsed if bulk is None else min(bulk, elapsed)
+            finally:
+                gc.enable()
+
+        for entity, other in zip(single[:kept], many[:kept]):
+            if entity.jsonable() != other.jsonable():
+                sys.exit(f"{category}: bulk factory output differs for {entity.url}")
+
+        print(f"{category:<12}{len(records):>10}{per_record:>11.3f}s{bulk:>9.3f}s"
+              f"{per_record / bulk:>8.1f}x  ({kept}/{total} snapshot records convertible)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,201 @@
+import argparse
+import gc
+import json
+import os
+import sys
+import tracemalloc
+
+FILE_PATH = os.path.dirname(os.path.abspath(__file__))  # Windows friendly
+CACHING_PATH = os.path.join(FILE_PATH, '..', 'caching')
+DATA_DIR = os.path.join(FILE_PATH, '..', 'recursive_functions', 'swapi_data')
+COUNTS = (10000, 100000)
+KINDS = ('crew', 'droid', 'passengers', 'person', 'planet', 'species', 'starship')
+
+sys.path.insert(0, os.path.abspath(CACHING_PATH))
+
+import swapi_compact
+import swapi_solution
+
+
+def read_snapshot(category):
+    """Return the first entity in a swapi_< category >.json snapshot file."""
+
+    with open(os.path.join(DATA_DIR, f"swapi_{category}.json"), 'r', encoding='utf-8') as file_obj:
+        return json.load(file_obj)[0]
+
+
+def build_templates(module):
+    """Return a function per entity kind that creates one fully populated instance of that
+    kind using the classes defined in < module >. Attribute values are converted once and shared
+    by every instance, so that the measurement reflects per-instance overhead only.
+
+    Parameters:
+        module (module): swapi_solution or swapi_compact
+
+    Returns:
+        dict: {< kind >: < function >}
+    """
+
+    person_data = read_snapshot('people')
+    planet_data = read_snapshot('planets')
+    species_data = read_snapshot('species')
+    starship_data = read_snapshot('starships')
+
+    height = float(person_data['height'])
+    mass = float(person_data['mass'])
+    climate = planet_data['climate'].split(', ')
+    terrain = planet_data['terrain'].split(', ')
+    population = int(planet_data['population'])
+    length = float(starship_data['length'])
+    hyperdrive_rating = float(starship_data['hyperdrive_rating'])
+
+    def create_planet():
+        planet = module.Planet(planet_data['url'], planet_data['name'])
+        planet.region = 'Outer Rim Territories'
+        planet.sector = 'Arkanis'
+        planet.suns = 2
+        planet.moons = 3
+        planet.orbital_period_days = 304.0
+        planet.diameter_km = 10465
+        planet.gravity = planet_data['gravity']
+        planet.climate = climate
+        planet.terrain = terrain
+        planet.population = population
+        return planet
+
+    def create_species():
+        species = module.Species(species_data['url'], species_data['name'])
+        species.classification = species_data['classification']
+        species.designation = species_data['designation']
+        species.language = species_data['language']
+        return species
+
+    homeworld = create_planet()
+    species = create_species()
+
+    def create_person():
+        person = module.Person(person_data['url'], person_data['name'], person_data['birth_year'])
+        person.height = height
+        person.mass = mass
+        person.homeworld = homeworld
+        person.species = species
+        person.force_sensitive = True
+        return person
+
+    def create_droid():
+        droid = module.Droid('https://swapi.py4e.com/api/people/3/', 'R2-D2', 'R2 series')
+        droid.manufacturer = 'Industrial Automaton'
+        droid.create_year = '33 BBY'
+        droid.height = 1.09
+        droid.mass = 32.0
+        droid.equipment = terrain
+        return droid
+
+    def create_starship():
+        starship = module.Starship(
+            starship_data['url'],
+            starship_data['name'],
+            starship_data['model'],
+            starship_data['starship_class']
+            )
+        starship.manufacturer = starship_data['manufacturer']
+        starship.length = length
+        starship.max_atmosphering_speed = 1050
+        starship.hyperdrive_rating = hyperdrive_rating
+        starship.MGLT = 70
+        starship.armament = terrain
+        starship.crew = 4
+        starship.passengers = 6
+        starship.cargo_capacity = 100000
+        starship.consumables = starship_data['consumables']
+        return starship
+
+    pilot = create_person()
+    droid = create_droid()
+
+    return {
+        'crew': lambda: module.Crew({'pilot': pilot, 'astro_mech_droid': droid}),
+        'droid': create_droid,
+        'passengers': lambda: module.Passengers([pilot, droid]),
+        'person': create_person,
+        'planet': create_planet,
+        'species': create_species,
+        'starship': create_starship
+    }
+
+
+def measure(create, count, serialize=False):
+    """Create < count > instances and return the bytes allocated per instance as traced by
+    < tracemalloc >. The list holding the instances is excluded.
+
+    Since Python 3.11 an instance's < __dict__ > is only built when it is first accessed.
+    The regular < Crew > and < Passengers > classes read < self.__dict__ > in < jsonable() >, so
+    pass < serialize=True > to measure instances that have been serialized once.
+
+    Parameters:
+        create (function): returns a new instance
+        count (int): number of instances
+        serialize (bool): call < jsonable() > on each instance (output discarded)
+
+    Returns:
+        float: bytes per instance
+    """
+
+    gc.collect()
+    tracemalloc.start()
+
+    instances = [None] * count
+    baseline = tracemalloc.get_traced_memory()[0]
+    for i in range(count):
+        instances[i] = create()
+        if serialize:
+            instances[i].jsonable()
+    allocated = tracemalloc.get_traced_memory()[0] - baseline
+
+    tracemalloc.stop()
+    del instances
+    gc.collect()
+
+    return allocated / count
+
+
+def main():
+    """Entry point. Reports the memory held per entity instance for the regular classes in
+    swapi_solution.py and the slotted classes in swapi_compact.py. Usage:
+
+        python entity_memory.py
+        python entity_memory.py person starship --counts 10000 100000 1000000
+        python entity_memory.py crew passengers --serialize
+    """
+
+    parser = argparse.ArgumentParser(description='Measure bytes per SWAPI entity instance')
+    parser.add_argument('kinds', nargs='*', help=f"any of {', '.join(KINDS)} (default: all)")
+    parser.add_argument('--counts', type=int, nargs='+', default=COUNTS, help='instance counts')
+    parser.add_argument(
+        '--serialize', action='store_true', help='call jsonable() on each instance first'
+        )
+    args = parser.parse_args()
+
+    kinds = args.kinds or list(KINDS)
+    for kind in kinds:
+        if kind not in KINDS:
+            parser.error(f"unknown entity kind: {kind}")
+
+    regular = build_templates(swapi_solution)
+    compact = build_templates(swapi_compact)
+
+    for kind in kinds:
+        if regular[kind]().jsonable() != compact[kind]().jsonable():
+            sys.exit(f"{kind}: jsonable() output differs between the two classes")
+
+    print(f"{'entity':<12}{'count':>10}{'regular':>10}{'compact':>10}{'saved':>8}  (bytes/entity)")
+    for kind in kinds:
+        for count in args.counts:
+            regular_bytes = measure(regular[kind], count, args.serialize)
+            compact_bytes = measure(compact[kind], count, args.serialize)
+            saved = 1 - compact_bytes / regular_bytes
+            print(f"{kind:<12}{count:>10}{regular_bytes:>10.0f}{compact_bytes:>10.0f}{saved:>8.0%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,286 @@
+import argparse
+import hashlib
+import http.server
+import json
+import math
+import os
+import random
+import threading
+import time
+import urllib.parse
+
+FILE_PATH = os.path.dirname(os.path.abspath(__file__))  # Windows friendly
+DATA_DIR = os.path.join(FILE_PATH, '..', 'recursive_functions', 'swapi_data')
+SWAPI_ENDPOINT = 'https://swapi.py4e.com/api'
+CATEGORIES = ('films', 'people', 'planets', 'species', 'starships', 'vehicles')
+PAGE_SIZE = 10
+
+# SWAPI ?search= matches these fields (case-insensitive substring)
+SEARCH_FIELDS = {
+    'films': ('title',),
+    'people': ('name',),
+    'planets': ('name',),
+    'species': ('name',),
+    'starships': ('name', 'model'),
+    'vehicles': ('name', 'model')
+}
+
+
+class FakeSwapiHandler(http.server.BaseHTTPRequestHandler):
+    """Request handler that answers SWAPI GET requests from snapshot data held by the server.
+
+    Routes:
+        /api/                           root resource (category urls)
+        /api/< category >/              paged list; optional ?page=N and ?search=term
+        /api/< category >/< id >/       single entity
+
+    Responses carry an ETag; a matching If-None-Match request header yields 304 Not Modified.
+    """
+
+    protocol_version = 'HTTP/1.1' # keep-alive
+    disable_nagle_algorithm = True # headers and body are written separately
+
+    def do_GET(self):
+        """Apply latency and error injection, then route the request."""
+
+        server = self.server
+        server.count_request()
+
+        delay = server.latency + random.uniform(0, server.jitter)
+        if delay:
+            time.sleep(delay)
+
+        if server.error_rate and random.random() < server.error_rate:
+            self.send_json({'detail': 'Service Unavailable'}, server.error_status)
+            return
+
+        parts = urllib.parse.urlsplit(self.path)
+        segments = [segment for segment in parts.path.split('/') if segment]
+        query = dict(urllib.parse.parse_qsl(parts.query))
+
+        if not segments or segments[0] != 'api':
+            self.send_json({'detail': 'Not found'}, 404)
+        elif len(segments) == 1:
+            self.send_json({category: f"{server.endpoint}/{category}/" for category in CATEGORIES})
+        elif segments[1] not in server.entities:
+            self.send_json({'detail': 'Not found'}, 404)
+        elif len(segments) == 2:
+            self.send_page(segments[1], query)
+        elif len(segments) == 3:
+            entity = server.entities[segments[1]].get(segments[2])
+            if entity is None:
+                self.send_json({'detail': 'Not found'}, 404)
+            else:
+                self.send_json(entity)
+        else:
+            self.send_json({'detail': 'Not found'}, 404)
+
+    def send_page(self, category, query):
+        """Send one page of a (possibly filtered) category list in SWAPI envelope format."""
+
+        server = self.server
+        records = list(server.entities[category].values())
+
+        term = query.get('search')
+        if term:
+            term = term.lower()
+            fields = SEARCH_FIELDS[category]
+            records = [
+                record for record in records
+                if any(term in record[field].lower() for field in fields)
+            ]
+
+        try:
+            page = int(query.get('page', 1))
+        except ValueError:
+            page = 0
+        pages = max(1, math.ceil(len(records) / PAGE_SIZE))
+        if not 1 <= page <= pages:
+            self.send_json({'detail': 'Not found'}, 404)
+            return
+
+        def page_url(number):
+            args = {'search': term} if term else {}
+            args['page'] = number
+            return f"{server.endpoint}/{category}/?{urllib.parse.urlencode(args)}"
+
+        self.send_json(
+            {
+                'count': len(records),
+                'next': page_url(page + 1) if page < pages else None,
+                'previous': page_url(page - 1) if page > 1 else None,
+                'results': records[(page - 1) * PAGE_SIZE:page * PAGE_SIZE]
+            }
+            )
+
+    def send_json(self, data, status=200):
+        """Encode and send a JSON response, honoring If-None-Match for 200 responses."""
+
+        body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        etag = '"' + hashlib.md5(body).hexdigest() + '"'
+
+        if status == 200 and self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        if status == 200:
+            self.send_header('ETag', etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        """Silence per-request logging."""
+
+        pass
+
+
+class FakeSwapiServer(http.server.ThreadingHTTPServer):
+    """Local stand-in for swapi.py4e.com that serves the snapshot files in
+    recursive_functions/swapi_data/ with SWAPI pagination and ?search= semantics. Entity urls in
+    the snapshots are rewritten to point at the local server. Latency, jitter and an error rate
+    can be injected to model a remote API.
+
+    Attributes:
+        endpoint (str): base url of the local API (e.g., 'http://127.0.0.1:8000/api')
+        entities (dict): {< category >: {< id >: < entity >}}
+        latency (float): fixed delay added to every response, in seconds
+        jitter (float): maximum additional random delay, in seconds
+        error_rate (float): fraction of requests answered with < error_status >
+        error_status (int): HTTP status code of injected errors
+        requests (int): number of requests received
+
+    Methods:
+        start: serve requests on a daemon thread
+        stop: shut the server down
+    """
+
+    daemon_threads = True
+
+    def __init__(self, host='127.0.0.1', port=0, data_dir=DATA_DIR, latency=0.0, jitter=0.0,
+                 error_rate=0.0, error_status=503):
+        """Initialize a FakeSwapiServer instance. Port 0 binds a free port."""
+
+        super().__init__((host, port), FakeSwapiHandler)
+        self.endpoint = f"http://{host}:{self.server_address[1]}/api"
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.requests = 0
+        self._requests_lock = threading.Lock()
+        self._thread = None
+        self.entities = load_snapshots(data_dir, self.endpoint)
+
+    def __enter__(self):
+        """Start serving on entering a with block."""
+
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        """Stop serving on leaving a with block."""
+
+        self.stop()
+
+    def count_request(self):
+        """Increment the request counter (thread-safe)."""
+
+        with self._requests_lock:
+            self.requests += 1
+
+    def start(self):
+        """Serve requests on a daemon thread.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Shut the server down and close its socket.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+
+        self.shutdown()
+        self.server_close()
+        if self._thread:
+            self._thread.join()
+
+
+def load_snapshots(data_dir, endpoint):
+    """Reads the swapi_< category >.json entity snapshots and indexes each category's entities
+    by id in ascending order. Urls are rewritten from swapi.py4e.com to < endpoint >.
+
+    Parameters:
+        data_dir (str): directory holding the snapshot files
+        endpoint (str): base url of the local API
+
+    Returns:
+        dict: {< category >: {< id >: < entity >}}
+    """
+
+    entities = {}
+    for category in CATEGORIES:
+        path = os.path.join(data_dir, f"swapi_{category}.json")
+        with open(path, 'r', encoding='utf-8') as file_obj:
+            content = file_obj.read().replace(SWAPI_ENDPOINT, endpoint)
+
+        records = {}
+        for record in json.loads(content):
+            records[int(record['url'].rstrip('/').rsplit('/', 1)[-1])] = record
+
+        entities[category] = {str(key): records[key] for key in sorted(records)}
+
+    return entities
+
+
+def main():
+    """Run the fake SWAPI server in the foreground. Usage:
+
+        python fake_swapi.py --port 8000 --latency 0.05 --jitter 0.02 --error-rate 0.01
+    """
+
+    parser = argparse.ArgumentParser(description='Local fake SWAPI server')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds per response')
+    parser.add_argument('--jitter', type=float, default=0.0, help='max extra random seconds')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of errors')
+    parser.add_argument('--error-status', type=int, default=503)
+    args = parser.parse_args()
+
+    server = FakeSwapiServer(
+        args.host,
+        args.port,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        error_status=args.error_status
+        )
+    print(f"Serving fake SWAPI at {server.endpoint}/ (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,186 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from fake_swapi import FakeSwapiServer
+
+FILE_PATH = os.path.dirname(os.path.abspath(__file__))  # Windows friendly
+ROOT_PATH = os.path.join(FILE_PATH, '..')
+
+# Searches issued by caching/swapi_solution.py main()
+QUERIES = (
+    ('species', 'wookiee'),
+    ('planets', 'hoth'),
+    ('people', 'r2-d2'),
+    ('people', 'leia organa'),
+    ('starships', 'T-70 x-wing'),
+    ('people', 'poe'),
+    ('people', 'bb8'),
+    ('planets', 'jakku'),
+    ('people', 'rey'),
+    ('people', 'finn'),
+    ('starships', 'falcon'),
+    ('people', 'han solo'),
+    ('people', 'chewbacca')
+)
+CATEGORIES = ('films', 'people', 'planets', 'species', 'starships', 'vehicles')
+
+
+def bench_crawl_recursive(endpoint):
+    """Crawl every category with recursive_functions/swapi_data.get_records_recursively()."""
+
+    import swapi_data
+
+    for category in CATEGORIES:
+        swapi_data.get_records_recursively(f"{endpoint}/{category}/", [])
+
+
+def _fetch_people(swapi_solution, filepath, endpoint):
+    """Issue the main() searches, then fetch each person's homeworld and species by id."""
+
+    for category, term in QUERIES:
+        url = f"{endpoint}/{category}"
+        data = swapi_solution.get_swapi_resource(filepath, url, {'search': term})
+        if category == 'people':
+            if data.get('homeworld'):
+                swapi_solution.get_swapi_resource(filepath, data['homeworld'])
+            if data.get('species'):
+                swapi_solution.get_swapi_resource(filepath, data['species'][0])
+
+
+def bench_cache_cold(endpoint):
+    """Sequential get_swapi_resource() lookups against an empty cache."""
+
+    import swapi_solution
+
+    _fetch_people(swapi_solution, 'cache.json', endpoint)
+    swapi_solution.get_swapi_cache('cache.json').flush()
+
+
+def bench_cache_warm(endpoint):
+    """Sequential get_swapi_resource() lookups against the cache populated by setup."""
+
+    import swapi_solution
+
+    _fetch_people(swapi_solution, 'cache.json', endpoint)
+
+
+def bench_cache_batch(endpoint):
+    """Concurrent get_swapi_resources() lookups against an empty cache."""
+
+    import swapi_solution
+
+    resources = [(f"{endpoint}/{category}", {'search': term}) for category, term in QUERIES]
+    people = swapi_solution.get_swapi_resources('cache.json', resources)
+
+    urls = []
+    for data in people:
+        if data.get('homeworld'):
+            urls.append(data['homeworld'])
+        if data.get('species'):
+            urls.append(data['species'][0])
+    swapi_solution.get_swapi_resources('cache.json', urls)
+    swapi_solution.get_swapi_cache('cache.json').flush()
+
+
+# name: (lesson directory, benchmark function, untimed setup function or None)
+BENCHMARKS = {
+    'crawl_recursive': ('recursive_functions', bench_crawl_recursive, None),
+    'cache_cold': ('caching', bench_cache_cold, None),
+    'cache_warm': ('caching', bench_cache_warm, bench_cache_cold),
+    'cache_batch': ('caching', bench_cache_batch, None)
+}
+
+
+def run_benchmark(name, endpoint):
+    """Run a single benchmark in the current process and return its wall time (excluding
+    setup). Called in a child process (see < main() >): the lesson directory is put on sys.path
+    and the working directory is a scratch directory so that cache files start empty.
+
+    Parameters:
+        name (str): benchmark name
+        endpoint (str): base url of the API
+
+    Returns:
+        float: elapsed seconds
+    """
+
+    directory, func, setup = BENCHMARKS[name]
+    sys.path.insert(0, os.path.abspath(os.path.join(ROOT_PATH, directory)))
+
+    with tempfile.TemporaryDirectory() as scratch:
+        os.chdir(scratch)
+        with contextlib.redirect_stdout(io.StringIO()): # silence progress output
+            if setup:
+                setup(endpoint)
+            start = time.perf_counter()
+            func(endpoint)
+            elapsed = time.perf_counter() - start
+        os.chdir(FILE_PATH)
+
+    return elapsed
+
+
+def main():
+    """Entry point. Starts a fake SWAPI server and runs each benchmark in a fresh Python
+    process (the caching and recursive_functions lessons each ship their own swapi_http module,
+    and a fresh process also starts with cold in-memory caches and connection pools). Usage:
+
+        python swapi_bench.py --latency 0.05 --jitter 0.01 --repeat 3
+
+    Reported request counts include requests made during setup.
+    """
+
+    parser = argparse.ArgumentParser(description='Benchmark SWAPI caching and crawling paths')
+    parser.add_argument(
+        'benchmarks', nargs='*', help=f"any of {', '.join(BENCHMARKS)} (default: all)"
+        )
+    parser.add_argument('--latency', type=float, default=0.02, help='seconds per response')
+    parser.add_argument('--jitter', type=float, default=0.0, help='max extra random seconds')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of errors')
+    parser.add_argument('--repeat', type=int, default=1, help='runs per benchmark (best kept)')
+    parser.add_argument('--run', help=argparse.SUPPRESS) # child process mode
+    parser.add_argument('--endpoint', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        print(json.dumps({'seconds': run_benchmark(args.run, args.endpoint)}))
+        return
+
+    names = args.benchmarks or list(BENCHMARKS)
+    for name in names:
+        if name not in BENCHMARKS:
+            parser.error(f"unknown benchmark: {name}")
+
+    server = FakeSwapiServer(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate)
+
+    print(f"fake SWAPI {server.endpoint} latency={args.latency}s jitter={args.jitter}s "
+          f"error_rate={args.error_rate}")
+    print(f"{'benchmark':<20}{'seconds':>10}{'requests':>10}")
+
+    with server:
+        for name in names:
+            best = None
+            for _ in range(args.repeat):
+                before = server.requests
+                output = subprocess.run(
+                    [sys.executable, __file__, '--run', name, '--endpoint', server.endpoint],
+                    check=True,
+                    capture_output=True,
+                    text=True
+                    ).stdout
+                seconds = json.loads(output.strip().splitlines()[-1])['seconds']
+                if best is None or seconds < best[0]:
+                    best = (seconds, server.requests - before)
+
+            print(f"{name:<20}{best[0]:>10.3f}{best[1]:>10}")
+
+
+if __name__ == '__main__':
+    main()
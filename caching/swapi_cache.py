@@ -0,0 +1,1002 @@
+import argparse
+import atexit
+import bz2
+import collections
+import contextlib
+import copy
+import gzip
+import json
+import lzma
+import os
+import sqlite3
+import stat
+import tempfile
+import threading
+import time
+import urllib.parse
+
+from swapi_metrics import emit, hooks
+
+try:
+    import fcntl # POSIX
+except ImportError:
+    fcntl = None
+    import msvcrt # Windows
+
+FLUSH_INTERVAL = 5.0 # seconds between write-behind flushes
+FLUSH_THRESHOLD = 50 # dirty entries that trigger an immediate flush
+FORMAT_VERSION = 2 # JSON cache document format
+LOCK_SUFFIX = '.lock' # sidecar file locked while a JSON cache file is rewritten
+SQLITE_EXTENSIONS = ('.db', '.sqlite', '.sqlite3')
+
+# Compressed JSON cache files, selected by extension (e.g., cache.json.gz)
+COMPRESSORS = {
+    '.gz': gzip.open,
+    '.bz2': bz2.open,
+    '.xz': lzma.open,
+    '.lzma': lzma.open
+}
+
+
+class CacheEntry:
+    """A cached value and its bookkeeping. An alias entry carries no value of its own; it
+    refers to the cache item id of the entry that holds the value.
+
+    Attributes:
+        value (dict): decoded SWAPI representation (None for an alias)
+        size (int): size of the value in bytes (UTF-8 encoded JSON)
+        stored_at (float): epoch seconds when the value was stored
+        expires_at (float): epoch seconds after which the value is stale (None = never)
+        ref (str): cache item id of the aliased entry (None for a value entry)
+        validators (dict): revalidation data, e.g., {'etag': ..., 'last_modified': ...}
+
+    Methods:
+        is_expired: return True if the entry is stale
+        record: return a JSON-friendly dict representation of the entry
+    """
+
+    __slots__ = ('value', 'size', 'stored_at', 'expires_at', 'ref', 'validators')
+
+    def __init__(self, value, size=None, stored_at=None, expires_at=None, ref=None,
+                 validators=None):
+        """Initialize a CacheEntry instance. The size is computed if not provided."""
+
+        self.value = value
+        if size is None:
+            if ref is None:
+                size = len(json.dumps(value, ensure_ascii=False).encode('utf-8'))
+            else:
+                size = len(ref.encode('utf-8'))
+        self.size = size
+        self.stored_at = stored_at
+        self.expires_at = expires_at
+        self.ref = ref
+        self.validators = validators
+
+    def is_expired(self, now):
+        """Return True if the entry has an expiry time that has passed.
+
+        Parameters:
+            now (float): current epoch seconds
+
+        Returns:
+            bool: True if stale
+        """
+
+        return self.expires_at is not None and self.expires_at <= now
+
+    def record(self):
+        """Return a JSON-friendly representation of the entry for storage.
+
+        Parameters:
+            None
+
+        Returns:
+            dict: storage record
+        """
+
+        record = {
+            'data': self.value,
+            'stored_at': self.stored_at,
+            'expires_at': self.expires_at
+            }
+        if self.ref is not None:
+            record['ref'] = self.ref
+        if self.validators:
+            record['validators'] = self.validators
+
+        return record
+
+
+class JsonCacheBackend:
+    """Cache storage backed by a single JSON document. The whole document must be decoded to
+    serve any lookup, so the backend is preloaded into memory by < SwapiCache > and every write
+    rewrites the file.
+
+    Writes are atomic: the document is written to a temporary file in the same directory which
+    then replaces the cache file, so a process that dies mid-write leaves the previous version
+    intact. Compact mode drops indentation and separator whitespace, which shrinks the file and
+    speeds up decoding. Files ending in .gz, .bz2, .xz or .lzma are compressed (and compact).
+
+    Several processes may share a cache file. Each write holds an exclusive advisory lock on a
+    sidecar < filepath >.lock file (see < lock_file() >) and merges this process's updates and
+    deletions into the current document, re-reading it first if another process has replaced it,
+    so no process overwrites entries written by another. A deletion is skipped if another
+    process has since stored the entry again. < get() > picks up entries written by other
+    processes after < load() >.
+
+    Document format:
+        {"format": 2, "entries": {< cache item id >: {"data": ..., "stored_at": ...,
+        "expires_at": ..., "ref": ..., "validators": ...}}} ("ref" and "validators" are
+        present only when set)
+
+    Legacy documents ({< cache item id >: < value >}) are read as entries that never expire,
+    with their keys canonicalized (see < legacy_cache_item_id() >).
+
+    Attributes:
+        filepath (str): path to the JSON cache file
+        compact (bool): write without indentation or separator whitespace
+        preload (bool): True; entries are loaded in full when the cache is first used
+
+    Methods:
+        load: read and decode the cache file
+        get: look up an entry written by another process since the file was last read
+        write: merge updates and deletions into the stored document and rewrite the file
+        close: release resources (no-op)
+    """
+
+    preload = True
+
+    def __init__(self, filepath, compact=False):
+        """Initialize a JsonCacheBackend instance."""
+
+        self.filepath = filepath
+        self._opener = COMPRESSORS.get(os.path.splitext(filepath)[1].lower(), open)
+        self.compact = compact or self._opener is not open
+        self._records = {}
+        self._signature = None # (inode, size, mtime) of the file version held in _records
+
+    def _stat(self):
+        """Return the (inode, size, mtime) signature of the cache file or None if missing."""
+
+        try:
+            info = os.stat(self.filepath)
+        except OSError:
+            return None
+
+        return info.st_ino, info.st_size, info.st_mtime_ns
+
+    def _read(self, force=False):
+        """Read and decode the cache file into < _records > unless it is unchanged since it was
+        last read. Returns True if the file was read.
+        """
+
+        signature = self._stat()
+        if not force and signature == self._signature:
+            return False
+
+        try:
+            with self._opener(self.filepath, 'rt', encoding='utf-8') as file_obj:
+                document = json.load(file_obj)
+        except (OSError, EOFError, ValueError):
+            document = {}
+
+        if document.get('format') == FORMAT_VERSION:
+            self._records = document['entries']
+        else:
+            self._records = { # legacy: url-as-given keys, re-keyed to match new lookups
+                legacy_cache_item_id(key): {'data': val} for key, val in document.items()
+            }
+        self._signature = signature
+
+        return True
+
+    def load(self):
+        """Read and decode the cache file. A missing or unreadable file yields an empty cache.
+
+        Parameters:
+            None
+
+        Returns:
+            dict: storage records keyed by cache item id
+        """
+
+        self._read(force=True)
+
+        return dict(self._records)
+
+    def get(self, key):
+        """Look up an entry missing from the preloaded records. The file is re-read only if
+        another process has replaced it since it was last read (one stat call otherwise).
+
+        Parameters:
+            key (str): cache item id
+
+        Returns:
+            dict: storage record or None if not stored
+        """
+
+        if not self._read():
+            return None
+
+        return self._records.get(key)
+
+    def write(self, updates, deletions=()):
+        """Merge updates and deletions into the stored document and atomically replace the file.
+        Holds the sidecar lock file throughout so that concurrent writers are serialized and
+        each one merges into the latest document. Where two processes stored the same entry the
+        more recently stored record wins.
+
+        Parameters:
+            updates (dict): storage records to add or replace
+            deletions (iterable): cache item ids to remove
+
+        Returns:
+            None
+        """
+
+        with lock_file(self.filepath + LOCK_SUFFIX):
+            known = self._records
+            self._read()
+            records = self._records
+
+            for key, record in updates.items():
+                current = records.get(key)
+                if current is None or current is known.get(key) or (
+                    (record.get('stored_at') or 0) >= (current.get('stored_at') or 0)
+                    ):
+                    records[key] = record
+
+            for key in deletions:
+                current = records.get(key)
+                if current is not None and current.get('stored_at') == (
+                    known.get(key) or {}
+                    ).get('stored_at'):
+                    del records[key] # unchanged since this process read it
+
+            self._replace(records)
+            self._signature = self._stat()
+
+    def _replace(self, records):
+        """Write < records > to a temporary file and atomically replace the cache file with it.
+        """
+
+        document = {'format': FORMAT_VERSION, 'entries': records}
+        if self.compact:
+            options = {'separators': (',', ':')}
+        else:
+            options = {'indent': 2}
+
+        directory, name = os.path.split(os.path.abspath(self.filepath))
+        fd, temp_path = tempfile.mkstemp(prefix=f".{name}.", suffix='.tmp', dir=directory)
+        os.close(fd)
+        try:
+            with self._opener(temp_path, 'wt', encoding='utf-8') as file_obj:
+                json.dump(document, file_obj, ensure_ascii=False, **options)
+
+            try:
+                mode = stat.S_IMODE(os.stat(self.filepath).st_mode) # keep existing permissions
+            except OSError:
+                mode = 0o644 # mkstemp() creates files readable by owner only
+            os.chmod(temp_path, mode)
+            os.replace(temp_path, self.filepath)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+    def close(self):
+        """Nothing to release."""
+
+        pass
+
+
+class SqliteCacheBackend:
+    """Cache storage backed by an SQLite database holding one row per entry keyed by cache item
+    id. A lookup costs a primary key probe plus decoding a single entry, so neither startup nor
+    lookup time grows with the number of cached entities.
+
+    Attributes:
+        filepath (str): path to the SQLite database file
+        preload (bool): False; entries are read on demand
+
+    Methods:
+        load: return an empty dict (nothing is preloaded)
+        get: look up a single entry
+        write: insert, replace and delete entries in a single transaction
+        purge_expired: delete expired rows that cannot be revalidated
+        close: close the database connection
+    """
+
+    preload = False
+    columns = ( # added after key, data
+        ('stored_at', 'REAL'),
+        ('expires_at', 'REAL'),
+        ('ref', 'TEXT'),
+        ('validators', 'TEXT')
+        )
+
+    def __init__(self, filepath):
+        """Initialize a SqliteCacheBackend instance. Creates the entries table if required and
+        adds any bookkeeping columns missing from databases created by earlier versions. Both
+        happen in one write transaction (BEGIN IMMEDIATE), so processes opening the same new
+        database at once do not race to add the same column. The connection is shared with
+        the write-behind flush timer thread; < SwapiCache > serializes access to it.
+        """
+
+        self.filepath = filepath
+        self._conn = sqlite3.connect(filepath, check_same_thread=False)
+
+        columns = ', '.join([f"{name} {type_}" for name, type_ in self.columns])
+        self._conn.execute('BEGIN IMMEDIATE') # waits for other writers (sqlite3 timeout)
+        try:
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS entries '
+                f"(key TEXT PRIMARY KEY, data TEXT NOT NULL, {columns})"
+                )
+
+            existing = {row[1] for row in self._conn.execute('PRAGMA table_info(entries)')}
+            for name, type_ in self.columns:
+                if name not in existing: # legacy database
+                    self._conn.execute(f"ALTER TABLE entries ADD COLUMN {name} {type_}")
+        except BaseException:
+            self._conn.rollback()
+            raise
+
+        self._conn.commit()
+
+    def load(self):
+        """Entries are read on demand; there is nothing to preload."""
+
+        return {}
+
+    def get(self, key):
+        """Look up a single entry.
+
+        Parameters:
+            key (str): cache item id
+
+        Returns:
+            dict: storage record or None if not stored
+        """
+
+        row = self._conn.execute(
+            'SELECT data, stored_at, expires_at, ref, validators FROM entries WHERE key = ?',
+            (key,)
+            ).fetchone()
+        if row is None:
+            return None
+
+        record = {
+            'data': json.loads(row[0]),
+            'stored_at': row[1],
+            'expires_at': row[2],
+            'ref': row[3],
+            'validators': json.loads(row[4]) if row[4] else None
+            }
+        if row[3] is None:
+            record['size'] = len(row[0].encode('utf-8'))
+
+        return record
+
+    def write(self, updates, deletions=()):
+        """Insert or replace updated entries and delete removed ones in a single transaction.
+
+        Parameters:
+            updates (dict): storage records to add or replace
+            deletions (iterable): cache item ids to remove
+
+        Returns:
+            None
+        """
+
+        rows = [
+            (
+                key,
+                json.dumps(record['data'], ensure_ascii=False),
+                record.get('stored_at'),
+                record.get('expires_at'),
+                record.get('ref'),
+                json.dumps(record['validators']) if record.get('validators') else None
+            )
+            for key, record in updates.items()
+        ]
+        with self._conn:
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO entries '
+                '(key, data, stored_at, expires_at, ref, validators) VALUES (?, ?, ?, ?, ?, ?)',
+                rows
+                )
+            self._conn.executemany(
+                'DELETE FROM entries WHERE key = ?', [(key,) for key in deletions]
+                )
+
+    def purge_expired(self, now):
+        """Delete rows whose expiry time has passed. Rows with validators are kept; they can
+        be revalidated rather than refetched.
+
+        Parameters:
+            now (float): current epoch seconds
+
+        Returns:
+            int: number of rows deleted
+        """
+
+        with self._conn:
+            cursor = self._conn.execute(
+                'DELETE FROM entries WHERE expires_at <= ? AND validators IS NULL', (now,)
+                )
+
+        return cursor.rowcount
+
+    def close(self):
+        """Close the database connection."""
+
+        self._conn.close()
+
+
+class SwapiCache:
+    """Process-resident cache of decoded SWAPI responses layered over a storage backend. Lookups
+    are served from memory; preloaded backends (JSON) are read in full on first use, while
+    on-demand backends (SQLite) are probed per key on a memory miss. Preloaded backends are also
+    asked on a miss, so entries stored by other processes sharing the cache file are picked up.
+    New entries are marked dirty and written to the backend in batches (write-behind) rather
+    than on every miss.
+
+    An alias entry maps one cache item id onto another (e.g., a search query onto the entity it
+    found) so that the same entity is stored once however it was requested.
+
+    The resident set can be bounded by entry count and/or byte budget. When a bound is exceeded
+    the least recently used entries are evicted. Entries may carry a time-to-live; stale entries
+    are dropped on access unless they carry validators (e.g., an ETag), in which case they are
+    kept so the caller can revalidate them with a conditional request and < refresh() > them
+    instead of downloading them again. Evicted and expired entries are deleted from preloaded
+    backends, which hold exactly the resident set. On-demand backends keep evicted entries
+    (memory is the bounded tier); their expired rows are purged on flush.
+
+    A flush is triggered when:
+        1. < flush_threshold > dirty entries have accumulated
+        2. < flush_interval > seconds have elapsed since the first unflushed write
+        3. the interpreter exits (atexit hook)
+        4. < flush() > is called explicitly
+
+    Attributes:
+        backend (JsonCacheBackend|SqliteCacheBackend): storage backend
+        max_entries (int): maximum number of resident entries (None = unbounded)
+        max_bytes (int): maximum resident size in bytes of encoded values (None = unbounded)
+        ttl (float): default time-to-live in seconds (None = never expires)
+        flush_interval (float): seconds to wait before flushing dirty entries (None disables)
+        flush_threshold (int): number of dirty entries that forces a flush (None disables)
+
+    Methods:
+        get: return a copy of the cached value or None
+        set: store a value and mark it dirty
+        set_alias: map a cache item id onto another entry
+        get_validators: return the validators of a (possibly stale) entry
+        refresh: renew a stale entry's time-to-live after successful revalidation
+        stats: return hit/miss/eviction counters and resident size
+        flush: write dirty entries to the backend
+        close: flush, cancel any pending timer and close the backend
+    """
+
+    def __init__(self, backend, max_entries=None, max_bytes=None, ttl=None,
+                 flush_interval=FLUSH_INTERVAL, flush_threshold=FLUSH_THRESHOLD):
+        """Initialize a SwapiCache instance. The backend is not read until first use."""
+
+        self.backend = backend
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.flush_interval = flush_interval
+        self.flush_threshold = flush_threshold
+        self._entries = None # OrderedDict, least recently used first; loaded lazily
+        self._bytes = 0
+        self._dirty = set()
+        self._deleted = set()
+        self._pending = {} # dirty entries evicted before they were flushed
+        self._counters = {
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0,
+            'expirations': 0,
+            'revalidations': 0
+            }
+        self._lock = threading.RLock()
+        self._timer = None
+        self._closed = False
+        atexit.register(self.close)
+
+    def _load(self):
+        """Load the backend on first call; return the in-memory entries dict. Stale entries
+        without validators are discarded and entries beyond the bounds are evicted, oldest first.
+        """
+
+        if self._entries is None:
+            start = time.perf_counter() if hooks else None
+            now = time.time()
+            records = self.backend.load()
+            self._entries = collections.OrderedDict()
+            records = sorted(records.items(), key=lambda item: item[1].get('stored_at') or 0)
+            for key, record in records:
+                entry = self._create_entry(record)
+                if entry.is_expired(now) and not entry.validators:
+                    self._counters['expirations'] += 1
+                    self._deleted.add(key)
+                else:
+                    self._entries[key] = entry
+                    self._bytes += entry.size
+            self._evict()
+
+            if hooks:
+                emit(
+                    'cache_load',
+                    seconds=time.perf_counter() - start,
+                    entries=len(self._entries),
+                    backend=type(self.backend).__name__
+                    )
+
+        return self._entries
+
+    def _create_entry(self, record):
+        """Return a < CacheEntry > built from a storage record."""
+
+        return CacheEntry(
+            record.get('data'),
+            record.get('size'),
+            record.get('stored_at'),
+            record.get('expires_at'),
+            record.get('ref'),
+            record.get('validators')
+            )
+
+    def _evict(self):
+        """Evict least recently used entries until the resident set is within bounds. Caller
+        must hold the lock.
+        """
+
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+            ):
+            key, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.size
+            self._counters['evictions'] += 1
+
+            if self.backend.preload:
+                self._dirty.discard(key)
+                self._deleted.add(key)
+            elif key in self._dirty:
+                self._dirty.discard(key)
+                self._pending[key] = entry
+
+    def _remove(self, key):
+        """Remove an expired entry from memory and schedule its deletion. Caller must hold the
+        lock.
+        """
+
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+        self._dirty.discard(key)
+        self._deleted.add(key)
+        self._counters['expirations'] += 1
+
+    def _lookup(self, key, now, stale=False):
+        """Return the fresh (or, if < stale > is True, possibly stale) resident entry for < key >,
+        reading it from an on-demand backend if required, or None. Stale entries that cannot be
+        revalidated are removed. Caller must hold the lock.
+        """
+
+        entries = self._load()
+
+        entry = entries.get(key)
+        if entry is None:
+            record = self._pending.get(key) or self.backend.get(key)
+            if record is not None:
+                entry = record if isinstance(record, CacheEntry) else self._create_entry(record)
+                entries[key] = entry # resident from now on
+                self._bytes += entry.size
+
+        if entry is not None and entry.is_expired(now):
+            if not entry.validators:
+                self._remove(key)
+                entry = None
+            elif not stale:
+                entry = None
+
+        if entry is not None:
+            entries.move_to_end(key)
+
+        return entry
+
+    def get(self, key):
+        """Return a copy of the cached value, following an alias to the entry it refers to.
+        Callers routinely update() the dictionaries they receive with supplemental data; handing
+        out copies keeps the resident entries clean.
+
+        Parameters:
+            key (str): cache item id
+
+        Returns:
+            dict: copy of the cached value or None if not cached or stale
+        """
+
+        with self._lock:
+            now = time.time()
+            entry = self._lookup(key, now)
+            if entry is not None and entry.ref is not None:
+                entry = self._lookup(entry.ref, now)
+
+            if entry is None:
+                self._counters['misses'] += 1
+                return None
+
+            self._counters['hits'] += 1
+            self._evict()
+            value = entry.value
+
+        return copy.deepcopy(value)
+
+    def set(self, key, value, ttl=None, validators=None):
+        """Store a value in memory and schedule it for writing.
+
+        Parameters:
+            key (str): cache item id
+            value (dict): decoded SWAPI representation
+            ttl (float): time-to-live in seconds (defaults to the cache's ttl)
+            validators (dict): optional revalidation data (e.g., {'etag': ...})
+
+        Returns:
+            None
+        """
+
+        self._store(key, copy.deepcopy(value), None, ttl, validators)
+
+    def set_alias(self, key, ref, ttl=None):
+        """Map a cache item id onto the entry stored under another id. Lookups of < key > then
+        return the value stored under < ref >.
+
+        Parameters:
+            key (str): cache item id of the alias
+            ref (str): cache item id of the entry holding the value
+            ttl (float): time-to-live in seconds (defaults to the cache's ttl)
+
+        Returns:
+            None
+        """
+
+        self._store(key, None, ref, ttl)
+
+    def get_validators(self, key):
+        """Return the validators of the entry stored under < key > (following an alias), even if
+        the entry is stale. Used to build a conditional request.
+
+        Parameters:
+            key (str): cache item id
+
+        Returns:
+            dict: copy of the entry's validators or None if none are held
+        """
+
+        with self._lock:
+            now = time.time()
+            entry = self._lookup(key, now, stale=True)
+            if entry is not None and entry.ref is not None:
+                entry = self._lookup(entry.ref, now, stale=True)
+
+            if entry is None or not entry.validators:
+                return None
+
+            return dict(entry.validators)
+
+    def refresh(self, key, ttl=None, validators=None):
+        """Renew the time-to-live of a (possibly stale) entry whose value has been confirmed
+        unchanged, e.g., by a 304 Not Modified response. The stored value is reused as is.
+
+        Parameters:
+            key (str): cache item id
+            ttl (float): time-to-live in seconds (defaults to the cache's ttl)
+            validators (dict): optional replacement validators
+
+        Returns:
+            dict: copy of the refreshed value or None if the entry is no longer cached
+        """
+
+        if ttl is None:
+            ttl = self.ttl
+
+        with self._lock:
+            now = time.time()
+            entry = self._lookup(key, now, stale=True)
+            if entry is None or entry.ref is not None:
+                return None
+
+            entry.stored_at = now
+            entry.expires_at = now + ttl if ttl is not None else None
+            if validators:
+                entry.validators = validators
+            self._dirty.add(key)
+            self._counters['revalidations'] += 1
+            self._schedule_flush()
+            value = entry.value
+
+        return copy.deepcopy(value)
+
+    def _store(self, key, value, ref, ttl, validators=None):
+        """Add a value or alias entry to the resident set and schedule it for writing."""
+
+        if ttl is None:
+            ttl = self.ttl
+
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        entry = CacheEntry(value, None, now, expires_at, ref, validators)
+
+        with self._lock:
+            entries = self._load()
+            previous = entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.size
+
+            entries[key] = entry
+            self._bytes += entry.size
+            self._dirty.add(key)
+            self._deleted.discard(key)
+            self._pending.pop(key, None)
+            self._evict()
+            self._schedule_flush()
+
+    def _schedule_flush(self):
+        """Flush now if the dirty threshold has been reached; otherwise start the flush timer
+        if it is not already running. Caller must hold the lock.
+        """
+
+        if self.flush_threshold and len(self._dirty) >= self.flush_threshold:
+            self._flush()
+        elif self.flush_interval and self._timer is None:
+            self._timer = threading.Timer(self.flush_interval, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def stats(self):
+        """Return cache counters and resident size.
+
+        Parameters:
+            None
+
+        Returns:
+            dict: hits, misses, evictions, expirations, revalidations, entries and bytes
+        """
+
+        with self._lock:
+            entries = self._load()
+            stats = dict(self._counters)
+            stats['entries'] = len(entries)
+            stats['bytes'] = self._bytes
+
+        return stats
+
+    def flush(self):
+        """Write dirty entries and deletions to the backend.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        """Flush implementation. Caller must hold the lock."""
+
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+
+        if not (self._dirty or self._deleted or self._pending):
+            return
+
+        start = time.perf_counter() if hooks else None
+
+        updates = {key: entry.record() for key, entry in self._pending.items()}
+        updates.update({key: self._entries[key].record() for key in self._dirty})
+        self.backend.write(updates, self._deleted)
+
+        if not self.backend.preload:
+            self.backend.purge_expired(time.time())
+
+        if hooks:
+            emit(
+                'cache_flush',
+                seconds=time.perf_counter() - start,
+                entries=len(updates) + len(self._deleted),
+                backend=type(self.backend).__name__
+                )
+
+        self._dirty.clear()
+        self._deleted.clear()
+        self._pending.clear()
+
+    def close(self):
+        """Flush pending writes, cancel the flush timer and close the backend.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            if self._closed:
+                return
+            self._flush()
+            self.backend.close()
+            self._closed = True
+
+
+def create_cache_item_id(url, params=None):
+    """Returns a canonical cache item id (synthetic key) for a url and optional query string
+    arguments. Equivalent requests map to the same key regardless of how they are spelled:
+
+        1. scheme and host are lowercased; the path is lowercased, its percent-encoding
+           normalized and a trailing slash added (SWAPI paths are case-insensitive)
+        2. query string arguments embedded in the url are merged with < params >
+        3. arguments are sorted by name; 'search' terms are lowercased and whitespace collapsed
+           (SWAPI searches are case-insensitive)
+
+    Key format:
+        < url >|< key >-< val >|< key >-< val > e.g.,
+        "https://swapi.py4e.com/api/people/|search-leia organa"
+
+    Parameters:
+        url (str): a url that specifies the resource.
+        params (dict): optional dictionary of querystring arguments.
+
+    Returns:
+        str: cache item id
+    """
+
+    parts = urllib.parse.urlsplit(url.strip())
+    path = urllib.parse.quote(urllib.parse.unquote(parts.path).lower())
+    if not path.endswith('/'):
+        path += '/'
+    url = f"{parts.scheme.lower()}://{parts.netloc.lower()}{path}"
+
+    args = dict(urllib.parse.parse_qsl(parts.query))
+    if params:
+        args.update(params)
+
+    pattern = ''
+    for key, val in sorted((str(key).lower(), str(val)) for key, val in args.items()):
+        if key == 'search':
+            val = ' '.join(val.lower().split())
+        pattern += '|' + key + '-' + val
+
+    return url + pattern
+
+
+def legacy_cache_item_id(key):
+    """Returns the canonical cache item id (see < create_cache_item_id() >) of a key written by
+    the original cache, which appended query string arguments to the url as given, e.g.,
+    "https://swapi.py4e.com/api/people|search-leia organa" ->
+    "https://swapi.py4e.com/api/people/|search-leia organa".
+
+    Parameters:
+        key (str): legacy cache item id (< url >|< key >-< val >|...)
+
+    Returns:
+        str: cache item id
+    """
+
+    url, *pairs = key.split('|')
+    params = {}
+    for pair in pairs:
+        name, _, val = pair.partition('-')
+        params[name] = val
+
+    return create_cache_item_id(url, params)
+
+
+@contextlib.contextmanager
+def lock_file(filepath):
+    """Context manager that holds an exclusive advisory lock on < filepath > (created if
+    required), blocking until it is available. Uses flock() on POSIX and msvcrt.locking() on
+    Windows. The lock is advisory: it only excludes processes that also take it. The file is
+    left in place; removing it would let two processes lock different files.
+
+    Parameters:
+        filepath (str): path to the lock file
+
+    Returns:
+        generator: context manager
+    """
+
+    fd = os.open(filepath, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        if fcntl:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        else:
+            while True:
+                try:
+                    msvcrt.locking(fd, msvcrt.LK_LOCK, 1) # retries for ~10 seconds, then raises
+                    break
+                except OSError:
+                    continue
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    finally:
+        os.close(fd)
+
+
+def open_cache_backend(filepath, compact=False):
+    """Returns the storage backend appropriate to the cache file's extension. Files ending in
+    .db, .sqlite or .sqlite3 are opened as SQLite databases; anything else is treated as JSON
+    (compressed if the name ends in .gz, .bz2, .xz or .lzma).
+
+    Parameters:
+        filepath (str): path to the cache file
+        compact (bool): write JSON cache files without whitespace
+
+    Returns:
+        JsonCacheBackend|SqliteCacheBackend: storage backend
+    """
+
+    if os.path.splitext(filepath)[1].lower() in SQLITE_EXTENSIONS:
+        return SqliteCacheBackend(filepath)
+
+    return JsonCacheBackend(filepath, compact)
+
+
+def migrate_json_cache(json_path, sqlite_path):
+    """One-shot migration of a JSON cache file into an SQLite cache database. Existing rows with
+    the same cache item id are replaced. The JSON file is left untouched.
+
+    Parameters:
+        json_path (str): path to the source JSON cache file
+        sqlite_path (str): path to the target SQLite database (created if required)
+
+    Returns:
+        int: number of entries migrated
+    """
+
+    records = JsonCacheBackend(json_path).load()
+
+    backend = SqliteCacheBackend(sqlite_path)
+    try:
+        backend.write(records)
+    finally:
+        backend.close()
+
+    return len(records)
+
+
+def main():
+    """Command line entry point. Usage:
+
+        python swapi_cache.py migrate cache.json cache.sqlite
+    """
+
+    parser = argparse.ArgumentParser(description='SWAPI cache maintenance')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    migrate = commands.add_parser('migrate', help='copy a JSON cache into an SQLite cache')
+    migrate.add_argument('json_path')
+    migrate.add_argument('sqlite_path')
+
+    args = parser.parse_args()
+
+    if args.command == 'migrate':
+        count = migrate_json_cache(args.json_path, args.sqlite_path)
+        print(f"Migrated {count} entries from {args.json_path} to {args.sqlite_path}")
+
+
+if __name__ == '__main__':
+    main()
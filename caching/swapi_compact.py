@@ -0,0 +1,535 @@
+import sys
+
+# Compact variants of the swapi_solution entity classes. Each class declares __slots__, so its
+# instances hold attribute values in a fixed array instead of a per-instance __dict__. Names,
+# constructor signatures, attributes and jsonable() output match swapi_solution. Crew and
+# Passengers hold their members in one flat tuple (key, member, key, member, ...); members
+# remain readable as attributes (e.g., crew.pilot).
+#
+# Compare bytes per entity with benchmarks/entity_memory.py.
+
+
+class Crew:
+    """Representation of a Starship or Vehicle crew.
+
+    Attributes:
+        Crew members are readable as attributes named after their position (e.g., pilot).
+
+    Methods:
+        jsonable: return JSON-friendly dict representation of the object
+    """
+
+    __slots__ = ('_members',)
+
+    def __init__(self, members):
+        """Initialize Crew instance.
+
+        Parameters:
+            members (dict): crew members dictionary (< position >: < Person >)
+
+        Returns:
+            None
+        """
+
+        self._members = tuple([item for pair in members.items() for item in pair])
+
+    def __getattr__(self, name):
+        """Return the crew member assigned to position < name >. Called only when normal
+        attribute lookup fails."""
+
+        if name != '_members':
+            members = self._members
+            for i in range(0, len(members), 2):
+                if members[i] == name:
+                    return members[i + 1]
+
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def __str__(self):
+        """Return a string representation of each crew member per the following format:
+
+        < position >: < crew member name > e.g., "pilot: Han Solo, copilot: Chewbacca"
+        """
+
+        if not self._members:
+            return None
+
+        members = self._members
+        return ', '.join([f"{key}: {val}" for key, val in zip(members[::2], members[1::2])])
+
+    def jsonable(self):
+        """Returns a JSON-friendly representation of the object.
+
+        Parameters:
+            None
+
+        Returns:
+            dict: dictionary of crew members (< position >: < member dict >)
+        """
+
+        members = self._members
+        return {key: val.jsonable() for key, val in zip(members[::2], members[1::2])}
+
+
+class Droid:
+    """Representation of a mechanical being that possesses artificial intelligence.
+
+    Attributes:
+        url (str): identifier/locator
+        name (str): droid name
+        model (str): droid model
+        manufacturer (str): creator
+        create_year (str): droid's year of manufacture (akin to birth_year)
+        height (float): droid's height in meters
+        mass (float): droid's mass in kilograms
+        equipment (list): droid's equipment, if any
+        instructions (list): language modules, flight plans, etc.
+
+    Methods:
+        jsonable: return JSON-friendly dict representation of the object
+        store_instructions: provides Droid instance with data to store
+    """
+
+    __slots__ = (
+        'url', 'name', 'model', 'manufacturer', 'create_year', 'height', 'mass', 'equipment',
+        'instructions'
+        )
+
+    def __init__(self, url, name, model):
+        """Initialize a Droid instance."""
+
+        self.url = url
+        self.name = name
+        self.model = model
+        self.manufacturer = None
+        self.create_year = None
+        self.height = None
+        self.mass = None
+        self.equipment = None
+        self.instructions = []
+
+    def __str__(self):
+        """Return a string representation of the object."""
+
+        return self.name
+
+    def store_instructions(self, instructions):
+        """Provide droid with special instructions such as language modules, flight
+        plans, etc.
+
+        Parameters:
+            instructions (dict): nested dictionaries of key-value pairs of instructions
+
+        Returns:
+            None
+        """
+
+        self.instructions.append(instructions)
+
+    def jsonable(self):
+        """Returns a JSON-friendly representation of the object.
+
+        Parameters:
+            None
+
+        Returns:
+            dict: dictionary of the object's instance variables
+        """
+
+        return {
+                'url': self.url,
+                'name': self.name,
+                'model': self.model,
+                'manufacturer': self.manufacturer,
+                'create_year': self.create_year,
+                'height': self.height,
+                'mass': self.mass,
+                'equipment': self.equipment,
+                'instructions': self.instructions
+            }
+
+
+class Passengers:
+    """Representation of passengers carried on a Starship or Vehicle.
+
+    Attributes:
+        Passengers are readable as attributes named after the passenger (lowercase; spaces
+        replaced by underscores, e.g., "Luke Skywalker" to "luke_skywalker").
+
+    Methods:
+        jsonable: return JSON-friendly dict representation of the object
+    """
+
+    __slots__ = ('_members',)
+
+    def __init__(self, passengers):
+        """Initialize Passengers instance. A later passenger with the same key name replaces
+        an earlier one.
+
+        Parameters:
+            passengers (list): list of < Person > and/or < Droid > objects
+
+        Returns:
+            None
+        """
+
+        members = {}
+        for person in passengers:
+            key = sys.intern(person.name.lower().replace(' ', '_')) # shared, as with setattr()
+            members[key] = person
+
+        self._members = tuple([item for pair in members.items() for item in pair])
+
+    def __getattr__(self, name):
+        """Return the passenger stored under key name < name >. Called only when normal
+        attribute lookup fails."""
+
+        if name != '_members':
+            members = self._members
+            for i in range(0, len(members), 2):
+                if members[i] == name:
+                    return members[i + 1]
+
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def __str__(self):
+        """Return a string representation of each passenger (passenger name only)."""
+
+        if not self._members:
+            return None
+
+        return ', '.join([val.name for val in self._members[1::2]])
+
+    def jsonable(self):
+        """Returns a JSON-friendly representation of the object.
+
+        Parameters:
+            None
+
+        Returns:
+            list: list of passenger dictionaries
+        """
+
+        return [val.jsonable() for val in self._members[1::2]]
+
+
+class Person:
+    """Representation of a person.
+
+    Attributes:
+        url (str): identifer/locator
+        name (str): person name
+        birth_year (str): person's birth_year
+        height (float): person's height in centimeters
+        mass (float): person's weight in kilograms
+        homeworld (Planet): person's home planet
+        species (Species): species of person
+        force_sensitive (bool): ability to harness the power of the Force.
+
+    Methods:
+        jsonable: return JSON-friendly dict representation of the object
+    """
+
+    __slots__ = (
+        'url', 'name', 'birth_year', 'height', 'mass', 'homeworld', 'species', 'force_sensitive'
+        )
+
+    def __init__(self, url, name, birth_year, force_sensitive=False):
+        """Initialize a Person instance."""
+
+        self.url = url
+        self.name = name
+        self.birth_year = birth_year
+        self.height = None
+        self.mass = None
+        self.homeworld = None
+        self.species = None
+        self.force_sensitive = force_sensitive
+
+    def __str__(self):
+        """Return a string representation of the object."""
+
+        return self.name
+
+    def jsonable(self):
+        """Return a JSON-friendly representation of the object.
+
+        Parameters:
+            None
+
+        Returns:
+            dict: dictionary of the object's instance variables
+        """
+
+        if self.homeworld:
+            homeworld = self.homeworld.jsonable()
+        else:
+            homeworld = None
+
+        if self.species:
+            species = self.species.jsonable()
+        else:
+            species = None
+
+        return {
+                'url': self.url,
+                'name': self.name,
+                'birth_year': self.birth_year,
+                'height': self.height,
+                'mass': self.mass,
+                'homeworld': homeworld,
+                'species': species,
+                'force_sensitive': self.force_sensitive
+            }
+
+
+class Planet:
+    """Representation of a planet.
+
+    Attributes:
+        url (str): identifier/locator
+        name (str): planet name
+        region (str): region name
+        sector (str): sector name
+        suns (int): number of suns
+        moons (int): number of moons
+        orbital_period_days (float): orbital period around sun(s) measured in days
+        diameter_km (int): diameter of planet measured in kilometers
+        gravity (dict): gravity level
+        climate (list): climate type(s) found on planet
+        terrain (list): terrain type(s) found on planet
+        population (int): population size
+
+    Methods:
+        jsonable: return JSON-friendly dict representation of the object
+    """
+
+    __slots__ = (
+        'url', 'name', 'region', 'sector', 'suns', 'moons', 'orbital_period_days', 'diameter_km',
+        'gravity', 'climate', 'terrain', 'population',
+        '__weakref__' # shared instances are registered in a weakref IdentityMap
+        )
+
+    def __init__(self, url, name):
+        """Initialize a Planet instance."""
+
+        self.url = url
+        self.name = name
+        self.region = None
+        self.sector = None
+        self.suns = None
+        self.moons = None
+        self.orbital_period_days = None
+        self.diameter_km = None
+        self.gravity = None
+        self.climate = None
+        self.terrain = None
+        self.population = None
+
+    def __str__(self):
+        """Return a string representation of the object."""
+
+        return self.name
+
+    def jsonable(self):
+        """Return a JSON-friendly representation of the object.
+
+        Parameters:
+            None
+
+        Returns:
+            dict: dictionary of the object's instance variables
+        """
+
+        return {
+                'url': self.url,
+                'name': self.name,
+                'region': self.region,
+                'sector': self.sector,
+                'suns': self.suns,
+                'moons': self.moons,
+                'orbital_period_days': self.orbital_period_days,
+                'diameter_km': self.diameter_km,
+                'gravity': self.gravity,
+                'climate': self.climate,
+                'terrain': self.terrain,
+                'population': self.population
+            }
+
+
+class Species:
+    """A unit of biodiversity.
+
+    Attributes:
+        url (str): identifier/locator
+        name (str): common name
+        classification (str): classifier (e.g., 'mammal', 'reptile')
+        designation (str): designation (e.g., 'sentient')
+        language (str): language commonly spoken by species
+
+    Methods:
+        jsonable: return JSON-friendly dict representation of the object.
+    """
+
+    __slots__ = (
+        'url', 'name', 'classification', 'designation', 'language',
+        '__weakref__' # shared instances are registered in a weakref IdentityMap
+        )
+
+    def __init__(self, url, name):
+        """Initialize a Species instance."""
+
+        self.url = url
+        self.name = name
+        self.classification = None
+        self.designation = None
+        self.language = None
+
+    def __str__(self):
+        """Human-readable string representation of the object."""
+
+        return self.name
+
+    def jsonable(self):
+        """Return a JSON-friendly representation of the object.
+
+        Parameters:
+            None
+
+        Returns:
+            dict: dictionary of the object's instance variable values
+        """
+
+        return {
+            'url': self.url,
+            'name': self.name,
+            'classification': self.classification,
+            'designation': self.designation,
+            'language': self.language
+            }
+
+
+class Starship:
+    """A crewed vehicle used for traveling in realspace or hyperspace.
+
+    Attributes:
+        url (str): identifier/locator
+        name (str): starship name or nickname
+        model (str): manufacturer's model name
+        starship_class (str): class of starship
+        manufacturer (str): starship builder
+        length (float): starship length
+        max_atmosphering_speed (int): max sub-orbital speed
+        hyperdrive_rating (float): lightspeed propulsion system rating
+        MGLT (int): megalight per hour traveled
+        armament [list]: offensive and defensive weaponry
+        crew (int): crew size
+        crew_members (Crew): Crew instance assigned to starship
+        passengers (int): number of passengers starship rated to carry
+        passengers_on_board (Passengers): passengers on board starship
+        cargo_capacity (float): cargo metric tonnage starship rated to carry
+        consumables (str): max period in months before on-board provisions must be replenished
+        pilots (list): < Person > instances known to have flown the starship (None if unknown;
+                       not serialized)
+
+    Methods:
+        assign_crew: assign < Crew > instance to starship
+        add_passengers: assign < Passengers > instance to starship
+        jsonable: return JSON-friendly dict representation of the object
+    """
+
+    __slots__ = (
+        'url', 'name', 'model', 'starship_class', 'manufacturer', 'length',
+        'max_atmosphering_speed', 'hyperdrive_rating', 'MGLT', 'armament', 'crew', 'crew_members',
+        'passengers', 'passengers_on_board', 'cargo_capacity', 'consumables', 'pilots'
+        )
+
+    def __init__(self, url, name, model, starship_class):
+        """Initalize instance of a Starship."""
+
+        self.url = url
+        self.name = name
+        self.model = model
+        self.starship_class = starship_class
+        self.manufacturer = None
+        self.length = None
+        self.max_atmosphering_speed = None
+        self.hyperdrive_rating = None
+        self.MGLT = None
+        self.armament = None
+        self.crew = None
+        self.crew_members = None
+        self.passengers = None
+        self.passengers_on_board = None
+        self.cargo_capacity = None
+        self.consumables = None
+        self.pilots = None
+
+    def __str__(self):
+        """String representation of the object."""
+
+        return self.model # not name (which is usually too generic)
+
+    def add_passengers(self, passengers):
+        """Add passengers to starship if passenger accommodations are available.
+
+        Parameters:
+            passengers (Passengers): object containing < Person > and/or < Droid > instances
+
+        Returns:
+            None
+        """
+
+        if self.passengers > 0:
+            self.passengers_on_board = passengers
+
+    def assign_crew_members(self, crew):
+        """Assign crew_members.
+
+        Parameters:
+            crew (Crew): object comprising crew members ('< role >': < Person> / < Droid >)
+
+        Returns:
+            None
+        """
+
+        self.crew_members = crew
+
+    def jsonable(self):
+        """Return a JSON-friendly representation of the object.
+
+        Parameters:
+            None
+
+        Returns:
+            dict: dictionary of the object's instance variables
+        """
+
+        if self.crew_members:
+            crew_members = self.crew_members.jsonable() # convert object
+        else:
+            crew_members = None
+
+        if self.passengers_on_board:
+            passengers_on_board = self.passengers_on_board.jsonable() # convert object
+        else:
+            passengers_on_board = None
+
+        return {
+            'url': self.url,
+            'name': self.name,
+            'model': self.model,
+            'starship_class': self.starship_class,
+            'manufacturer': self.manufacturer,
+            'length': self.length,
+            'max_atmosphering_speed': self.max_atmosphering_speed,
+            'hyperdrive_rating': self.hyperdrive_rating,
+            'MGLT': self.MGLT,
+            'armament': self.armament,
+            'crew': self.crew,
+            'crew_members': crew_members,
+            'passengers': self.passengers,
+            'passengers_on_board': passengers_on_board,
+            'cargo_capacity': self.cargo_capacity,
+            'consumables': self.consumables
+        }
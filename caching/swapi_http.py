@@ -0,0 +1,167 @@
+import concurrent.futures
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+POOL_CONNECTIONS = 4 # number of hosts to keep connection pools for
+POOL_MAXSIZE = 16 # keep-alive connections per host
+RETRIES = 3 # retries per request (connect, read and status errors)
+BACKOFF_FACTOR = 0.5 # sleep between retries: backoff_factor * 2 ** (retry - 1) seconds
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+_session = None
+_session_options = {}
+_session_lock = threading.Lock()
+
+
+def create_session(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, retries=RETRIES,
+                   backoff_factor=BACKOFF_FACTOR, status_forcelist=RETRY_STATUSES):
+    """Returns a new < requests.Session > that pools keep-alive connections and retries failed
+    GET requests with exponential backoff. Retry-After headers sent with 429/503 responses are
+    honored.
+
+    Parameters:
+        pool_connections (int): number of hosts to keep connection pools for
+        pool_maxsize (int): maximum number of keep-alive connections per host
+        retries (int): maximum number of retries per request
+        backoff_factor (float): exponential backoff factor in seconds
+        status_forcelist (tuple): HTTP status codes that trigger a retry
+
+    Returns:
+        requests.Session: configured session
+    """
+
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=status_forcelist,
+        allowed_methods=frozenset(['GET', 'HEAD']),
+        raise_on_status=False
+        )
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry
+        )
+
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+
+    return session
+
+
+def configure_session(**options):
+    """Sets the options used to build the shared session (see < create_session() >). Any
+    existing shared session is closed and replaced on next use.
+
+    Parameters:
+        options (dict): keyword arguments passed to < create_session() >
+
+    Returns:
+        None
+    """
+
+    global _session, _session_options
+
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = None
+        _session_options = options
+
+
+def get_session():
+    """Returns the process-wide shared session, creating it on first use. Sharing one session
+    lets every request to the same host reuse a pooled keep-alive connection instead of paying
+    for a new TCP/TLS handshake.
+
+    Parameters:
+        None
+
+    Returns:
+        requests.Session: shared session
+    """
+
+    global _session
+
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = create_session(**_session_options)
+
+    return _session
+
+
+def close_session():
+    """Closes the shared session and its pooled connections.
+
+    Parameters:
+        None
+
+    Returns:
+        None
+    """
+
+    global _session
+
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = None
+
+
+class SingleFlight:
+    """Coalesces concurrent calls that share a key. The first caller (the leader) runs the
+    function; callers that arrive while it is in flight wait for and share its result (or
+    exception) instead of issuing a duplicate request.
+
+    Methods:
+        do: run a function once per key among concurrent callers
+    """
+
+    def __init__(self):
+        """Initialize a SingleFlight instance."""
+
+        self._calls = {} # key: Future
+        self._lock = threading.Lock()
+
+    def do(self, key, func, *args, **kwargs):
+        """Run < func(*args, **kwargs) > unless a call with the same key is already in flight,
+        in which case wait for that call's outcome.
+
+        Parameters:
+            key (str): coalescing key (e.g., a cache item id)
+            func (function): function to call
+            args (tuple): positional arguments passed to func
+            kwargs (dict): keyword arguments passed to func
+
+        Returns:
+            object: the function's return value (shared by all coalesced callers)
+        """
+
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = concurrent.futures.Future()
+                self._calls[key] = future
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as err:
+            with self._lock:
+                del self._calls[key]
+            future.set_exception(err)
+            raise
+
+        with self._lock:
+            del self._calls[key]
+        future.set_result(result)
+
+        return result
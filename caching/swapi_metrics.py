@@ -0,0 +1,251 @@
+import atexit
+import bisect
+import json
+import os
+import sys
+import threading
+
+# Instrumentation is off unless a hook is registered. Call sites test < hooks > (one list
+# truthiness check) before timing anything or building event fields.
+hooks = []
+
+# Histogram bucket upper bounds in seconds (Prometheus client defaults)
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+ENV_VAR = 'SWAPI_METRICS' # file path; enables collection and a dump at exit
+PREFIX = 'swapi_'
+
+
+class Metrics:
+    """Hook that aggregates instrumentation events into counters and histograms. Each event
+    (see < emit() >) is converted as follows:
+
+        < event >_total counter, incremented once per event
+        seconds field -> < event >_seconds histogram
+        other numeric fields -> < event >_< field >_total counters
+        str fields -> labels of the event's metrics
+
+    Events emitted by the SWAPI cache path:
+
+        cache_hit, cache_miss                    lookups in get_swapi_resource()
+        search_index_hit                         searches answered by the local index
+        http_request (seconds, status, decoded_bytes)    SWAPI GET requests
+        cache_load (seconds, entries, backend)   SwapiCache backend loads
+        cache_flush (seconds, entries, backend)  SwapiCache write-behind flushes
+
+    Methods:
+        snapshot: return the current values as a JSON-friendly dict
+        to_json: return the snapshot as JSON text
+        to_prometheus: return the snapshot in Prometheus text exposition format
+        dump: write the snapshot to a file
+    """
+
+    def __init__(self, buckets=BUCKETS):
+        """Initialize a Metrics instance."""
+
+        self.buckets = tuple(buckets)
+        self._counters = {} # (name, labels): value
+        self._histograms = {} # (name, labels): [bucket counts..., sum, count]
+        self._lock = threading.Lock()
+
+    def __call__(self, event, fields):
+        """Record one event (hook interface).
+
+        Parameters:
+            event (str): event name
+            fields (dict): event fields
+
+        Returns:
+            None
+        """
+
+        labels = tuple(sorted([(key, val) for key, val in fields.items() if isinstance(val, str)]))
+        name = PREFIX + event
+
+        with self._lock:
+            self._add((f"{name}_total", labels), 1)
+
+            for key, val in fields.items():
+                if isinstance(val, str) or val is None:
+                    continue
+                if key == 'seconds':
+                    self._observe((f"{name}_seconds", labels), val)
+                else:
+                    self._add((f"{name}_{key}_total", labels), val)
+
+    def _add(self, key, value):
+        """Increment a counter. Caller must hold the lock."""
+
+        self._counters[key] = self._counters.get(key, 0) + value
+
+    def _observe(self, key, value):
+        """Add an observation to a histogram. Caller must hold the lock."""
+
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = self._histograms[key] = [0] * (len(self.buckets) + 3)
+
+        histogram[bisect.bisect_left(self.buckets, value)] += 1 # last bucket is +Inf
+        histogram[-2] += value
+        histogram[-1] += 1
+
+    def snapshot(self):
+        """Return the current metric values.
+
+        Parameters:
+            None
+
+        Returns:
+            dict: {'counters': [< counter >, ...], 'histograms': [< histogram >, ...]} where
+                  bucket counts are cumulative (Prometheus convention)
+        """
+
+        with self._lock:
+            counters = [
+                {'name': name, 'labels': dict(labels), 'value': value}
+                for (name, labels), value in sorted(self._counters.items())
+            ]
+
+            histograms = []
+            for (name, labels), values in sorted(self._histograms.items()):
+                buckets = {}
+                total = 0
+                for bound, count in zip(self.buckets + ('+Inf',), values[:-2]):
+                    total += count
+                    buckets[str(bound)] = total
+                histograms.append(
+                    {
+                        'name': name,
+                        'labels': dict(labels),
+                        'buckets': buckets,
+                        'sum': values[-2],
+                        'count': values[-1]
+                    }
+                )
+
+        return {'counters': counters, 'histograms': histograms}
+
+    def to_json(self):
+        """Return the snapshot as JSON text."""
+
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self):
+        """Return the snapshot in Prometheus text exposition format."""
+
+        def format_labels(labels, extra=None):
+            items = list(labels.items()) + ([extra] if extra else [])
+            if not items:
+                return ''
+            return '{' + ','.join([f'{key}="{val}"' for key, val in items]) + '}'
+
+        snapshot = self.snapshot()
+        lines = []
+        typed = set()
+
+        for counter in snapshot['counters']:
+            if counter['name'] not in typed:
+                typed.add(counter['name'])
+                lines.append(f"# TYPE {counter['name']} counter")
+            lines.append(f"{counter['name']}{format_labels(counter['labels'])} {counter['value']}")
+
+        for histogram in snapshot['histograms']:
+            name = histogram['name']
+            if name not in typed:
+                typed.add(name)
+                lines.append(f"# TYPE {name} histogram")
+            for bound, count in histogram['buckets'].items():
+                labels = format_labels(histogram['labels'], ('le', bound))
+                lines.append(f"{name}_bucket{labels} {count}")
+            labels = format_labels(histogram['labels'])
+            lines.append(f"{name}_sum{labels} {histogram['sum']}")
+            lines.append(f"{name}_count{labels} {histogram['count']}")
+
+        return '\n'.join(lines) + '\n'
+
+    def dump(self, filepath=None):
+        """Write the snapshot to < filepath > (Prometheus text if the name ends in .prom,
+        otherwise JSON) or to stderr as JSON.
+
+        Parameters:
+            filepath (str): output file path or None
+
+        Returns:
+            None
+        """
+
+        if filepath is None:
+            sys.stderr.write(self.to_json() + '\n')
+            return
+
+        text = self.to_prometheus() if filepath.endswith('.prom') else self.to_json()
+        with open(filepath, 'w', encoding='utf-8') as file_obj:
+            file_obj.write(text)
+
+
+def add_hook(hook):
+    """Registers an instrumentation hook. Hooks are called as < hook(event, fields) > from the
+    thread that emits the event and must be thread-safe.
+
+    Parameters:
+        hook (function): callable(event, fields)
+
+    Returns:
+        function: the hook
+    """
+
+    hooks.append(hook)
+    return hook
+
+
+def remove_hook(hook):
+    """Unregisters an instrumentation hook.
+
+    Parameters:
+        hook (function): previously registered hook
+
+    Returns:
+        None
+    """
+
+    if hook in hooks:
+        hooks.remove(hook)
+
+
+def emit(event, **fields):
+    """Passes an event to every registered hook. Call sites check < hooks > first so that
+    nothing is measured while instrumentation is disabled.
+
+    Parameters:
+        event (str): event name (e.g., 'cache_hit')
+        fields (dict): event fields (numbers become metrics, strings become labels)
+
+    Returns:
+        None
+    """
+
+    for hook in hooks:
+        hook(event, fields)
+
+
+def enable(filepath=None, at_exit=True):
+    """Enables metrics collection by registering a < Metrics > hook. By default the snapshot
+    is dumped when the interpreter exits (see < Metrics.dump() >).
+
+    Parameters:
+        filepath (str): dump file path (.prom for Prometheus text, otherwise JSON); None
+                        writes JSON to stderr
+        at_exit (bool): dump the snapshot at exit
+
+    Returns:
+        Metrics: the registered collector
+    """
+
+    metrics = add_hook(Metrics())
+    if at_exit:
+        atexit.register(metrics.dump, filepath)
+
+    return metrics
+
+
+if os.environ.get(ENV_VAR): # e.g., SWAPI_METRICS=metrics.prom python swapi_solution.py
+    enable(os.environ[ENV_VAR])
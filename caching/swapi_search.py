@@ -0,0 +1,236 @@
+import copy
+import threading
+
+# Local answers to SWAPI ?search= queries. SWAPI matches a search term as a case-insensitive
+# substring of an entity's searchable fields and lists matches in id order. Substrings are
+# found through an inverted index of character trigrams: the entities holding every trigram of
+# the term are the only candidates, and only those are compared with the term.
+GRAM = 3 # characters per indexed substring
+
+
+class CategoryIndex:
+    """Trigram index over the entities of one SWAPI category (e.g., people).
+
+    Attributes:
+        fields (tuple): searchable entity fields
+        complete (bool): True if every entity of the category has been added (e.g., from a
+                         snapshot), so that a search can be answered without SWAPI
+        loaded (bool): True once the index's loader has been tried for this category
+
+    Methods:
+        add: add or replace an entity
+        search: return the entities matching a term in SWAPI order
+    """
+
+    def __init__(self, fields):
+        """Initialize a CategoryIndex instance."""
+
+        self.fields = fields
+        self.complete = False
+        self.loaded = False
+        self._entities = {} # id: entity
+        self._values = {} # id: lowercased searchable values
+        self._grams = {} # trigram: set of ids
+
+    def __len__(self):
+        """Return the number of indexed entities."""
+
+        return len(self._entities)
+
+    def add(self, entity_id, entity, replace=True):
+        """Add an entity, replacing any entity with the same id unless < replace > is False.
+
+        Parameters:
+            entity_id (int): SWAPI id (the last segment of the entity url)
+            entity (dict): decoded SWAPI entity
+            replace (bool): replace an entity already indexed
+
+        Returns:
+            None
+        """
+
+        if entity_id in self._entities and not replace:
+            return
+
+        values = tuple([entity[field].lower() for field in self.fields if entity.get(field)])
+        previous = self._values.get(entity_id)
+        if previous != values:
+            if previous:
+                for gram in self._split(previous):
+                    self._grams[gram].discard(entity_id)
+            for gram in self._split(values):
+                self._grams.setdefault(gram, set()).add(entity_id)
+
+        self._entities[entity_id] = entity
+        self._values[entity_id] = values
+
+    def search(self, term):
+        """Return the entities whose searchable fields contain < term > (case-insensitive).
+
+        Parameters:
+            term (str): search term
+
+        Returns:
+            list: matching entities in id order
+        """
+
+        term = term.lower()
+        if len(term) < GRAM:
+            candidates = self._values # too short to index; compare with every entity
+        else:
+            postings = sorted(
+                [self._grams.get(gram, set()) for gram in self._split((term,))], key=len
+                )
+            candidates = postings[0].intersection(*postings[1:])
+
+        return [
+            self._entities[entity_id] for entity_id in sorted(candidates)
+            if any(term in val for val in self._values[entity_id])
+        ]
+
+    def _split(self, values):
+        """Return the set of trigrams found in < values >."""
+
+        return {val[i:i + GRAM] for val in values for i in range(len(val) - GRAM + 1)}
+
+
+class SearchIndex:
+    """Local index answering SWAPI ?search= queries across categories. Entities are added as
+    they are fetched or cached; a category can answer searches only once it is complete, i.e.,
+    all of its entities have been added from a full listing such as a snapshot. Otherwise an
+    entity missing from the index might also match, and the search must go to SWAPI.
+
+    A < loader > may be provided to complete categories on first use. It is called once per
+    category with the category url and returns that category's full entity list (or None).
+    Entities already added (e.g., fetched since the snapshot was taken) are kept.
+
+    Attributes:
+        fields (dict): searchable fields keyed by category name (default: name)
+        loader (function): optional callable(category url) returning a full entity list
+
+    Methods:
+        add: add entities, optionally marking their categories complete
+        is_complete: return True if a category can answer searches
+        search: return the entities matching a term, or None if the index cannot answer
+    """
+
+    def __init__(self, fields=None, loader=None):
+        """Initialize a SearchIndex instance."""
+
+        self.fields = fields or {}
+        self.loader = loader
+        self._categories = {} # category url: CategoryIndex
+        self._lock = threading.Lock()
+
+    def add(self, entities, complete=False, replace=True):
+        """Add copies of entities to the indexes of their categories. Responses that are not
+        entities (no 'url', or a url without an id, such as a page) are ignored.
+
+        Parameters:
+            entities (list): decoded SWAPI entities (from one or more categories)
+            complete (bool): the entities are the full listing of their categories
+            replace (bool): replace entities already indexed
+
+        Returns:
+            int: number of entities added
+        """
+
+        count = 0
+        with self._lock:
+            categories = set()
+            for entity in entities:
+                parts = self._split_url(entity.get('url'))
+                if parts is None:
+                    continue # not an entity (e.g., a page or a 404 body)
+                category = self._category(parts[0])
+                category.add(parts[1], copy.deepcopy(entity), replace) # callers may mutate theirs
+                categories.add(category)
+                count += 1
+
+            if complete:
+                for category in categories:
+                    category.complete = category.loaded = True
+
+        return count
+
+    def is_complete(self, url):
+        """Return True if the category at < url > is complete (its loader is run if required).
+
+        Parameters:
+            url (str): category url (e.g., https://swapi.py4e.com/api/people/)
+
+        Returns:
+            bool: True if searches in the category can be answered locally
+        """
+
+        with self._lock:
+            return self._load(self._normalize(url)).complete
+
+    def search(self, url, term):
+        """Return the entities in the category at < url > that SWAPI would return for a
+        ?search=< term > query, in SWAPI order, across all result pages.
+
+        Parameters:
+            url (str): category url (e.g., https://swapi.py4e.com/api/people/)
+            term (str): search term
+
+        Returns:
+            list: matching entities, or None if the category is not complete
+        """
+
+        with self._lock:
+            category = self._load(self._normalize(url))
+            if not category.complete:
+                return None
+
+            return category.search(term)
+
+    def _category(self, category_url):
+        """Return the index of a category, creating it if required. Caller must hold the lock.
+        """
+
+        category = self._categories.get(category_url)
+        if category is None:
+            name = category_url.rsplit('/', 1)[-1]
+            category = CategoryIndex(self.fields.get(name, ('name',)))
+            self._categories[category_url] = category
+
+        return category
+
+    def _load(self, category_url):
+        """Return the index of a category, running the loader on first use. Caller must hold
+        the lock.
+        """
+
+        category = self._category(category_url)
+        if not category.loaded:
+            category.loaded = True
+            entities = self.loader(category_url) if self.loader else None
+            if entities is not None:
+                for entity in entities:
+                    parts = self._split_url(entity.get('url'))
+                    if parts is None or parts[0] != category_url:
+                        break # not a listing of this category (e.g., another host)
+                    category.add(parts[1], entity, replace=False)
+                else:
+                    category.complete = True
+
+        return category
+
+    def _normalize(self, url):
+        """Return a category url without query string or trailing slash, lowercased."""
+
+        return url.split('?', 1)[0].rstrip('/').lower()
+
+    def _split_url(self, url):
+        """Return the (category url, id) pair of an entity url, or None if < url > is not an
+        entity url."""
+
+        if not isinstance(url, str) or '/' not in url:
+            return None
+
+        category_url, entity_id = self._normalize(url).rsplit('/', 1)
+        if not entity_id.isdigit():
+            return None
+
+        return category_url, int(entity_id)
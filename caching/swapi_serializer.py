@@ -0,0 +1,199 @@
+import json
+import math
+
+encode_string = json.encoder.encode_basestring # C accelerated when available
+
+# Serialized fields per entity class, keyed by class name so that the regular (swapi_solution)
+# and slotted (swapi_compact) classes share a layout. Field order matches < jsonable() >.
+ENTITY_FIELDS = {
+    'Droid': (
+        'url', 'name', 'model', 'manufacturer', 'create_year', 'height', 'mass', 'equipment',
+        'instructions'
+        ),
+    'Person': (
+        'url', 'name', 'birth_year', 'height', 'mass', 'homeworld', 'species', 'force_sensitive'
+        ),
+    'Planet': (
+        'url', 'name', 'region', 'sector', 'suns', 'moons', 'orbital_period_days', 'diameter_km',
+        'gravity', 'climate', 'terrain', 'population'
+        ),
+    'Species': ('url', 'name', 'classification', 'designation', 'language'),
+    'Starship': (
+        'url', 'name', 'model', 'starship_class', 'manufacturer', 'length',
+        'max_atmosphering_speed', 'hyperdrive_rating', 'MGLT', 'armament', 'crew', 'crew_members',
+        'passengers', 'passengers_on_board', 'cargo_capacity', 'consumables'
+        )
+}
+INDENT = 2
+
+
+class EntitySerializer:
+    """Streaming JSON serializer for entity graphs (< Starship >, < Crew >, < Passengers >,
+    < Person >, < Droid >, < Planet >, < Species >). Output is identical to
+    < json.dump(entity.jsonable(), ensure_ascii=False, indent=2) > but is written to the file
+    object piece by piece, without first building the nested dictionaries. The serialized form
+    of each sub-entity is memoized by identity (and nesting level), so a shared planet or a
+    droid that is both crew member and passenger is encoded once per call. Distinct instances
+    with the same url (e.g., a planet with and without supplemental data) are encoded apart.
+
+    Attributes:
+        compact (bool): write without whitespace
+        indent (int): indentation width (ignored if compact)
+
+    Methods:
+        dump: write an entity or plain value to a file object
+        iterencode: yield the JSON encoding of an entity or plain value in chunks
+    """
+
+    def __init__(self, compact=False, indent=INDENT):
+        """Initialize an EntitySerializer instance."""
+
+        self.compact = compact
+        self.indent = None if compact else indent
+        if compact:
+            self._encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+            self._colon = ':'
+        else:
+            self._encoder = json.JSONEncoder(ensure_ascii=False, indent=indent)
+            self._colon = ': '
+        self._memo = {} # (id(entity), level): (entity, serialized sub-entity)
+
+    def dump(self, obj, file_obj):
+        """Write the JSON encoding of < obj > to < file_obj >.
+
+        Parameters:
+            obj (object): entity instance or JSON-serializable value
+            file_obj (file): text file object open for writing
+
+        Returns:
+            None
+        """
+
+        write = file_obj.write
+        for chunk in self.iterencode(obj):
+            write(chunk)
+
+    def iterencode(self, obj):
+        """Yield the JSON encoding of < obj > in chunks. Memoized sub-entities are only valid
+        for the duration of one call.
+
+        Parameters:
+            obj (object): entity instance or JSON-serializable value
+
+        Returns:
+            generator: str chunks
+        """
+
+        self._memo = {}
+        try:
+            yield from self._encode(obj, 0)
+        finally:
+            self._memo = {}
+
+    def _encode(self, obj, level):
+        """Yield the chunks of < obj > nested < level > levels deep."""
+
+        name = type(obj).__name__
+        if name in ENTITY_FIELDS:
+            yield from self._encode_entity(obj, ENTITY_FIELDS[name], level)
+        elif name in ('Crew', 'Passengers'):
+            yield from self._encode_members(obj, level)
+        elif hasattr(obj, 'jsonable'):
+            yield self._encode_value(obj.jsonable(), level) # unknown entity class
+        else:
+            yield self._encode_value(obj, level)
+
+    def _encode_entity(self, entity, fields, level):
+        """Yield the chunks of an entity whose fields are listed in ENTITY_FIELDS. Nested
+        entities are encoded once per instance and level, then reused."""
+
+        if level:
+            key = (id(entity), level)
+            memo = self._memo.get(key)
+            if memo is None:
+                # Holding the entity keeps its id from being reused during the call
+                memo = entity, ''.join(self._encode_object(entity, fields, level))
+                self._memo[key] = memo
+            yield memo[1]
+        else:
+            yield from self._encode_object(entity, fields, level)
+
+    def _encode_object(self, entity, fields, level):
+        """Yield the chunks of a JSON object built from the entity's < fields >."""
+
+        items = [(field, getattr(entity, field)) for field in fields]
+        yield from self._encode_items(items, level)
+
+    def _encode_members(self, container, level):
+        """Yield the chunks of a < Crew > (object) or < Passengers > (list) instance, reading
+        its members in insertion order."""
+
+        if hasattr(container, '_members'): # swapi_compact: flat (key, member, ...) tuple
+            members = container._members
+            pairs = list(zip(members[::2], members[1::2]))
+        else:
+            pairs = list(container.__dict__.items())
+
+        if type(container).__name__ == 'Crew':
+            yield from self._encode_items(pairs, level)
+        else:
+            yield from self._encode_sequence([member for key, member in pairs], level)
+
+    def _encode_items(self, items, level):
+        """Yield the chunks of a JSON object from (key, value) pairs."""
+
+        if not items:
+            yield '{}'
+            return
+
+        inner = self._newline(level + 1)
+        yield '{'
+        for i, (key, val) in enumerate(items):
+            yield f"{',' if i else ''}{inner}{encode_string(key)}{self._colon}"
+            yield from self._encode(val, level + 1)
+        yield self._newline(level) + '}'
+
+    def _encode_sequence(self, values, level):
+        """Yield the chunks of a JSON array."""
+
+        if not values:
+            yield '[]'
+            return
+
+        inner = self._newline(level + 1)
+        yield '['
+        for i, val in enumerate(values):
+            yield f"{',' if i else ''}{inner}"
+            yield from self._encode(val, level + 1)
+        yield self._newline(level) + ']'
+
+    def _newline(self, level):
+        """Return the line break and indentation that precede an item at < level >."""
+
+        if self.compact:
+            return ''
+
+        return '\n' + ' ' * (self.indent * level)
+
+    def _encode_value(self, value, level):
+        """Return the encoding of a plain JSON-serializable value nested < level > levels deep.
+        Scalars are encoded directly. JSON strings cannot contain raw newlines, so indented
+        containers are re-indented by prefixing each line break."""
+
+        if value is None:
+            return 'null'
+        if value is True:
+            return 'true'
+        if value is False:
+            return 'false'
+        if type(value) is str:
+            return encode_string(value)
+        if type(value) is int or (type(value) is float and math.isfinite(value)):
+            return repr(value)
+
+        text = self._encoder.encode(value)
+        if self.compact or not level or '\n' not in text:
+            return text
+
+        return text.replace('\n', self._newline(level))
+
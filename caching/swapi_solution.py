@@ -1,9 +1,105 @@
+import concurrent.futures
+import copy
 import csv
+import functools
+import glob
 import json
+import operator
 import os
-import requests
+import threading
+import time
+import urllib.parse
+import weakref
+from swapi_cache import SwapiCache, create_cache_item_id, open_cache_backend
+from swapi_http import SingleFlight, get_session
+from swapi_metrics import emit, hooks
+from swapi_search import SearchIndex
+from swapi_serializer import EntitySerializer
+from swapi_tasks import Task, format_timings, run_tasks
 
 CACHE_NAME = 'cache.json' # constants are in ALL CAPS, no NOT change, and are GLOBAL
+MAX_WORKERS = 8 # concurrent SWAPI requests issued by get_swapi_resources()
+SNAPSHOT_DIR = os.path.join( # full SWAPI dump written by recursive_functions/swapi_data.py
+    os.path.dirname(os.path.abspath(__file__)), '..', 'recursive_functions', 'swapi_data'
+    )
+
+# SWAPI ?search= matches these entity fields (case-insensitive substring); default is name
+SEARCH_FIELDS = {
+    'films': ('title',),
+    'starships': ('name', 'model'),
+    'vehicles': ('name', 'model')
+}
+
+# Supplemental (Wookieepedia) records are matched on these fields, in order; default is name.
+# Two X-wing rows share a name, so starships are matched on model first.
+STARSHIP_MATCH_FIELDS = ('model', 'name')
+
+# Bulk factory schemas (see < compile_factory() >). 'args' are passed to the class constructor;
+# each optional field is converted and assigned when present. Field types: str, int, float,
+# ('list', < separator >) or ('lazy',) (a url or list of urls assigned to a LazyReference).
+DROID_SCHEMA = {
+    'args': ('url', 'name', 'model'),
+    'fields': {
+        'manufacturer': str,
+        'create_year': str,
+        'height': float,
+        'mass': float,
+        'equipment': ('list', '|')
+    }
+}
+PERSON_SCHEMA = {
+    'args': ('url', 'name', 'birth_year'),
+    'fields': {
+        'height': float,
+        'mass': float,
+        'force_sensitive': str # assigned as is
+    }
+}
+PLANET_SCHEMA = {
+    'args': ('url', 'name'),
+    'fields': {
+        'region': str,
+        'sector': str,
+        'suns': int,
+        'moons': int,
+        'orbital_period_days': float,
+        'diameter_km': int,
+        'gravity': str,
+        'climate': ('list', ', '),
+        'terrain': ('list', ', '),
+        'population': int
+    }
+}
+SPECIES_SCHEMA = {
+    'args': ('url', 'name'),
+    'fields': {
+        'classification': str,
+        'designation': str,
+        'language': str
+    }
+}
+STARSHIP_SCHEMA = {
+    'args': ('url', 'name', 'model', 'starship_class'),
+    'fields': {
+        'manufacturer': str,
+        'length': float,
+        'max_atmosphering_speed': int,
+        'hyperdrive_rating': float,
+        'MGLT': int,
+        'armament': ('list', ','),
+        'crew': int,
+        'passengers': int,
+        'cargo_capacity': int,
+        'consumables': str,
+        'pilots': ('lazy',) # list of urls, resolved on first access (see LazyReference)
+    }
+}
+
+_SWAPI_CACHES = {} # filepath: SwapiCache (process-resident)
+_SWAPI_CACHES_LOCK = threading.Lock() # one SwapiCache per filepath however many threads ask
+_IN_FLIGHT = SingleFlight() # coalesces concurrent misses for the same cache item id
+_FACTORIES = {} # (class, id(schema)): compiled factory
+_SEARCH_INDEX = SearchIndex(SEARCH_FIELDS, loader=lambda url: read_snapshot(url)) # ?search=
 
 
 class Crew:
@@ -144,6 +240,126 @@ class Droid:
             }
 
 
+class IdentityMap:
+    """Registry of shared entity instances keyed by canonical entity url (identity map /
+    flyweight). Entities are held by weak reference: an instance is dropped from the registry
+    once nothing else refers to it.
+
+    Methods:
+        get: return the registered instance for a url or None
+        add: register an instance unless one is already registered for its url
+        clear: forget all registered instances
+    """
+
+    def __init__(self):
+        """Initialize an IdentityMap instance."""
+
+        self._entities = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """Return the number of registered instances."""
+
+        return len(self._entities)
+
+    def get(self, url):
+        """Return the instance registered for < url >.
+
+        Parameters:
+            url (str): entity url
+
+        Returns:
+            object: registered instance or None
+        """
+
+        return self._entities.get(create_cache_item_id(url))
+
+    def add(self, entity):
+        """Register an entity by its url. If another thread registered the same entity first,
+        that instance wins and is returned instead.
+
+        Parameters:
+            entity (object): instance with a url attribute
+
+        Returns:
+            object: the registered instance
+        """
+
+        with self._lock:
+            return self._entities.setdefault(create_cache_item_id(entity.url), entity)
+
+    def clear(self):
+        """Forget all registered instances.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            self._entities.clear()
+
+
+_IDENTITY_MAP = IdentityMap() # shared Planet and Species instances
+_SUPPLEMENTED = weakref.WeakKeyDictionary() # shared Planet: supplemental index merged into it
+_SUPPLEMENTED_LOCK = threading.Lock()
+
+
+class LazyReference:
+    """Descriptor for an entity reference that is resolved on first access. Assigning a url
+    (or a list of urls) stores it unresolved. The first read calls < resolve(url) > (e.g.,
+    < get_planet() >, which reads through the SWAPI cache) and keeps the result, so entities
+    that are never read are never fetched or built. An unresolved reference may also be
+    assigned as a < functools.partial > that returns the entity. Entity instances and None are
+    stored as is.
+
+    The value is held in the instance attribute named after the descriptor with a leading
+    underscore (e.g., _homeworld).
+
+    Attributes:
+        resolve (function): returns the entity (or entities) for a url (or list of urls)
+        name (str): attribute name
+    """
+
+    def __init__(self, resolve):
+        """Initialize a LazyReference instance."""
+
+        self.resolve = resolve
+        self.name = None
+        self._attr = None
+
+    def __set_name__(self, owner, name):
+        """Record the attribute name the descriptor is assigned to."""
+
+        self.name = name
+        self._attr = f"_{name}"
+
+    def __get__(self, instance, owner=None):
+        """Return the referenced entity, resolving it on first access."""
+
+        if instance is None:
+            return self
+
+        value = getattr(instance, self._attr)
+        if isinstance(value, functools.partial):
+            value = value()
+            setattr(instance, self._attr, value)
+
+        return value
+
+    def __set__(self, instance, value):
+        """Store an entity, or a url (or list of urls) to resolve on first access."""
+
+        if isinstance(value, str) or (
+            isinstance(value, list) and value and all(isinstance(url, str) for url in value)
+            ):
+            value = functools.partial(self.resolve, value)
+
+        setattr(instance, self._attr, value)
+
+
 class Passengers:
     """Representation of passengers carried on a Starship or Vehicle.
 
@@ -219,14 +435,17 @@ class Person:
         birth_year (str): person's birth_year
         height (float): person's height in centimeters
         mass (float): person's weight in kilograms
-        homeworld (Planet): person's home planet
-        species (Species): species of person
+        homeworld (Planet): person's home planet (resolved from its url on first access)
+        species (Species): species of person (resolved from its url on first access)
         force_sensitive (bool): ability to harness the power of the Force.
 
     Methods:
         jsonable: return JSON-friendly dict representation of the object
     """
 
+    homeworld = LazyReference(lambda url: get_planet(url))
+    species = LazyReference(lambda url: get_species(url))
+
     def __init__(self, url, name, birth_year, force_sensitive=False):
         """Initialize a Person instance."""
 
@@ -421,6 +640,8 @@ class Starship:
         passengers_on_board (Passengers): passengers on board starship
         cargo_capacity (float): cargo metric tonnage starship rated to carry
         consumables (str): max period in months before on-board provisions must be replenished
+        pilots (list): < Person > instances known to have flown the starship (resolved from
+                       their urls on first access; None if unknown; not serialized)
 
     Methods:
         assign_crew: assign < Crew > instance to starship
@@ -428,6 +649,8 @@ class Starship:
         jsonable: return JSON-friendly dict representation of the object
     """
 
+    pilots = LazyReference(lambda urls: get_people(urls))
+
     def __init__(self, url, name, model, starship_class):
         """Initalize instance of a Starship."""
 
@@ -447,6 +670,7 @@ class Starship:
         self.passengers_on_board = None
         self.cargo_capacity = None
         self.consumables = None
+        self.pilots = None
 
     def __str__(self):
         """String representation of the object."""
@@ -521,10 +745,105 @@ class Starship:
         }
 
 
-def create_droid(data):
+def compile_factory(cls, schema):
+    """Compiles an entity schema into a factory function that creates one < cls > instance per
+    record. The schema is resolved once into a list of (attribute, converter) pairs. The
+    factory passes the constructor 'args' to < cls() >, so attributes keep their < __init__() >
+    order and defaults, then converts and assigns each truthy field value in turn. Lazy
+    reference fields are assigned through their descriptor; classes without one (e.g.,
+    swapi_compact.Starship) leave the attribute at its default.
+
+    Like the < create_* > functions, only truthy values are converted. Unlike them, numeric
+    placeholders such as 'unknown' or 'n/a' become None rather than raising ValueError, and
+    thousands separators are ignored (e.g., '1,600' -> 1600).
+
+    Parameters:
+        cls (class): entity class (e.g., < Planet > or swapi_compact.Planet)
+        schema (dict): constructor 'args' and optional 'fields' (see PLANET_SCHEMA)
+
+    Returns:
+        function: factory(record) -> < cls > instance
+    """
+
+    args = schema['args']
+    prototype = cls(*[None] * len(args))
+
+    fields = [] # (attribute, converter or None to assign the value as is)
+    for name, field_type in schema['fields'].items():
+        if field_type == ('lazy',):
+            if not isinstance(getattr(cls, name, None), LazyReference):
+                continue # nothing to resolve the urls with
+            convert = None
+        elif field_type is str:
+            convert = None
+        elif field_type is int:
+            convert = convert_int
+        elif field_type is float:
+            convert = convert_float
+        elif isinstance(field_type, tuple) and field_type[0] == 'list':
+            convert = operator.methodcaller('split', field_type[1])
+        else:
+            raise ValueError(f"Unsupported type for field {name}: {field_type}")
+
+        if not hasattr(prototype, name):
+            raise ValueError(f"Schema field {name} is not an attribute of {cls.__name__}")
+        fields.append((name, convert))
+
+    def factory(record):
+        entity = cls(*[record[key] for key in args])
+        get = record.get
+        for name, convert in fields:
+            value = get(name)
+            if value:
+                setattr(entity, name, convert(value) if convert else value)
+        return entity
+
+    return factory
+
+
+def convert_float(value):
+    """Converts a SWAPI value to a float, ignoring thousands separators.
+
+    Parameters:
+        value (str): value to convert (e.g., '1,600.5')
+
+    Returns:
+        float: converted value or None if the value is not numeric (e.g., 'unknown')
+    """
+
+    try:
+        return float(value)
+    except ValueError:
+        try:
+            return float(value.replace(',', ''))
+        except (AttributeError, ValueError):
+            return None
+
+
+def convert_int(value):
+    """Converts a SWAPI value to an int, ignoring thousands separators.
+
+    Parameters:
+        value (str): value to convert (e.g., '47,060')
+
+    Returns:
+        int: converted value or None if the value is not an integer (e.g., 'n/a')
+    """
+
+    try:
+        return int(value)
+    except ValueError:
+        try:
+            return int(value.replace(',', ''))
+        except (AttributeError, ValueError):
+            return None
+
+
+def create_droid(data, droids=None):
     """Creates a < Droid > instance from dictionary data, converting string values to the
-    appropriate type whenever possible. Adding special instructions constitutes a seperate
-    operation.
+    appropriate type whenever possible. If supplemental droid data is provided, the record
+    matching the droid's name is combined with the source data. Adding special instructions
+    constitutes a seperate operation.
 
     Type conversions:
         height (str->float)
@@ -533,11 +852,14 @@ def create_droid(data):
 
     Parameters:
         data (dict): source data
+        droids (dict|list): supplemental droid data (see < index_by_name() >)
 
     Returns:
         Droid: new < Droid > instance
     """
 
+    data = merge_supplement(data, droids)
+
     droid = Droid(data['url'], data['name'], data['model'])
 
     if data.get('manufacturer'):
@@ -558,27 +880,46 @@ def create_droid(data):
     return droid
 
 
-def create_person(data, planets=None):
+def create_droids(records, cls=Droid):
+    """Creates < Droid > instances in bulk with a factory compiled from DROID_SCHEMA (see
+    < compile_factory() >). Combine supplemental data with the records first.
+
+    Parameters:
+        records (iterable): source data (dictionaries)
+        cls (class): entity class to instantiate
+
+    Returns:
+        list: new < Droid > instances
+    """
+
+    return list(map(get_factory(cls, DROID_SCHEMA), records))
+
+
+def create_person(data, planets=None, people=None):
     """Creates a < Person > instance from dictionary data, converting string values to the
-    appropriate type whenever possible. Calls < get_swapi_resource() > to retrieve homeworld and
-    species data. Calls < create_planet() > and < create_species() > to add < Planet > and
-    < Species > objects to the person instance.
+    appropriate type whenever possible. If supplemental people data is provided, the record
+    matching the person's name is combined with the source data. The homeworld and species
+    are lazy references: < get_planet() > and < get_species() > add the shared < Planet > and
+    < Species > instances the first time the attribute is read.
 
     Type conversions:
         height (str->float)
         mass (str->float)
-        homeworld (str->Planet)
-        species (str->Species)
+        homeworld (str->Planet, on first access)
+        species (str->Species, on first access)
         force_sensitive (str->bool)
 
     Parameters:
         data (dict): source data
-        planets (list): supplemental planetary data
+        planets (dict|list): supplemental planetary data (see < index_by_name() >)
+        people (dict|list): supplemental people data (see < index_by_name() >)
 
     Returns:
         Person: new < Person > instance
     """
 
+    data = merge_supplement(data, people)
+
     # Instantiate person
     person = Person(data['url'], data['name'], data['birth_year'])
 
@@ -588,22 +929,11 @@ def create_person(data, planets=None):
     if data.get('mass'):
         person.mass = float(data.get('mass'))
 
-    # Get, combine, clean data, and instantiate Planet instance
     if data.get('homeworld'):
-        homeworld_data = get_swapi_resource(CACHE_NAME, data['homeworld'])
-
-        if planets:
-            for planet in planets:
-                if planet['name'].lower() == homeworld_data['name'].lower():
-                    homeworld_data.update(planet)
-                    break
-
-        person.homeworld = create_planet(homeworld_data)
+        person.homeworld = functools.partial(get_planet, data['homeworld'], planets) # lazy
 
-    # Get, clean data, and instantiate a new Species instance
     if data.get('species'):
-        species_data = get_swapi_resource(CACHE_NAME, data['species'][0])
-        person.species = create_species(species_data)
+        person.species = data['species'][0] # lazy
 
     # Note that falsy values (e.g., None, False, 0) returns False
     if data.get('force_sensitive'):
@@ -612,9 +942,53 @@ def create_person(data, planets=None):
     return person
 
 
-def create_planet(data):
+def create_people(records, planets=None, species=None, cls=Person):
+    """Creates < Person > instances in bulk with a factory compiled from PERSON_SCHEMA (see
+    < compile_factory() >). Homeworld and species urls are resolved against the < Planet > and
+    < Species > instances provided (e.g., the output of < create_planets() >). Other urls are
+    kept as lazy references, resolved through the SWAPI cache on first access only (classes
+    without lazy references, such as swapi_compact.Person, leave them set to None).
+
+    Parameters:
+        records (iterable): source data (dictionaries)
+        planets (iterable): < Planet > instances
+        species (iterable): < Species > instances
+        cls (class): entity class to instantiate
+
+    Returns:
+        list: new < Person > instances
+    """
+
+    factory = get_factory(cls, PERSON_SCHEMA)
+    planets = {create_cache_item_id(planet.url): planet for planet in planets or ()}
+    species = {create_cache_item_id(kind.url): kind for kind in species or ()}
+    lazy = isinstance(getattr(cls, 'homeworld', None), LazyReference) # else unresolved is None
+
+    people = []
+    for record in records:
+        person = factory(record)
+
+        url = record.get('homeworld')
+        if url:
+            person.homeworld = planets.get(create_cache_item_id(url), url if lazy else None)
+
+        url = record['species'][0] if record.get('species') else None
+        if url:
+            person.species = species.get(create_cache_item_id(url), url if lazy else None)
+
+        people.append(person)
+
+    return people
+
+
+def create_planet(data, planets=None):
     """Creates a < Planet > instance from dictionary data, converting string values to the
-    appropriate type whenever possible.
+    appropriate type whenever possible. If supplemental planetary data is provided, the record
+    matching the planet's name is combined with the source data.
+
+    A numeric placeholder (e.g., population 'unknown') or a thousands separator raises
+    ValueError. The bulk < create_planets() > does not: it converts '1,000' to 1000 and
+    placeholders to None.
 
     Type conversions:
         suns (str->int)
@@ -627,11 +1001,14 @@ def create_planet(data):
 
     Parameters:
         data (dict): source data
+        planets (dict|list): supplemental planetary data (see < index_by_name() >)
 
     Returns:
         Planet: new < Planet > instance
     """
 
+    data = merge_supplement(data, planets)
+
     planet = Planet(data['url'], data['name'])
 
     if data.get('region'):
@@ -667,6 +1044,21 @@ def create_planet(data):
     return planet
 
 
+def create_planets(records, cls=Planet):
+    """Creates < Planet > instances in bulk with a factory compiled from PLANET_SCHEMA (see
+    < compile_factory() >). Combine supplemental data with the records first.
+
+    Parameters:
+        records (iterable): source data (dictionaries)
+        cls (class): entity class to instantiate
+
+    Returns:
+        list: new < Planet > instances
+    """
+
+    return list(map(get_factory(cls, PLANET_SCHEMA), records))
+
+
 def create_species(data):
     """Returns a < Species > instance from provided dictionary data.
 
@@ -694,10 +1086,28 @@ def create_species(data):
     return species
 
 
-def create_starship(data):
+def create_species_list(records, cls=Species):
+    """Creates < Species > instances in bulk with a factory compiled from SPECIES_SCHEMA (see
+    < compile_factory() >).
+
+    Parameters:
+        records (iterable): source data (dictionaries)
+        cls (class): entity class to instantiate
+
+    Returns:
+        list: new < Species > instances
+    """
+
+    return list(map(get_factory(cls, SPECIES_SCHEMA), records))
+
+
+def create_starship(data, starships=None):
     """Creates a < Starship > instance from dictionary data, converting string values to the
-    appropriate type whenever possible. Assigning crews and passengers consitute separate
-    operations.
+    appropriate type whenever possible. If supplemental starship data is provided, the record
+    matching the starship's model (or failing that, its name) is combined with the source data.
+    Assigning crews and passengers consitute separate operations. As with < create_planet() >,
+    numeric placeholders (e.g., crew 'unknown') raise ValueError here but become None in the
+    bulk < create_starships() >.
 
     Type conversions:
         length (str->float)
@@ -708,14 +1118,18 @@ def create_starship(data):
         crew (str->int)
         passengers (str->int)
         cargo_capacity (str->int)
+        pilots (list->list of Person, on first access)
 
     Parameters:
         data (dict): source data
+        starships (dict|list): supplemental starship data (see < index_by_name() >)
 
     Returns:
         starship: a new < Starship > instance
     """
 
+    data = merge_supplement(data, starships, STARSHIP_MATCH_FIELDS)
+
     starship = Starship(data['url'], data['name'], data['model'], data['starship_class'])
 
     if data.get('manufacturer'):
@@ -748,20 +1162,112 @@ def create_starship(data):
     if data.get('consumables'):
         starship.consumables = data['consumables']
 
+    if data.get('pilots'):
+        starship.pilots = data['pilots'] # lazy
+
     return starship
 
 
-def create_cache_item_id(url, params):
-    # synthetic key
-    pattern = ''
-    if params:
-        for key, val in params.items():
-            pattern += '|' + str(key) + '-' + str(val)
-            # f": {str(key)} - {str(val)}"
-        url += pattern
-        return url
-    else:
-        return url
+def create_starships(records, cls=Starship):
+    """Creates < Starship > instances in bulk with a factory compiled from STARSHIP_SCHEMA (see
+    < compile_factory() >). Combine supplemental data with the records first.
+
+    Parameters:
+        records (iterable): source data (dictionaries)
+        cls (class): entity class to instantiate
+
+    Returns:
+        list: new < Starship > instances
+    """
+
+    return list(map(get_factory(cls, STARSHIP_SCHEMA), records))
+
+
+def get_factory(cls, schema):
+    """Returns the factory compiled for an entity class and schema, compiling it on first
+    use (see < compile_factory() >).
+
+    Parameters:
+        cls (class): entity class
+        schema (dict): module-level schema constant (e.g., PLANET_SCHEMA)
+
+    Returns:
+        function: factory(record) -> < cls > instance
+    """
+
+    key = (cls, id(schema))
+    factory = _FACTORIES.get(key)
+    if factory is None:
+        factory = _FACTORIES.setdefault(key, compile_factory(cls, schema))
+
+    return factory
+
+
+def get_people(urls):
+    """Returns a new < Person > instance for each person url. The person data is retrieved
+    concurrently with < get_swapi_resources() > and passed to < create_person() >.
+
+    Parameters:
+        urls (list): person urls
+
+    Returns:
+        list: new < Person > instances
+    """
+
+    return [create_person(data) for data in get_swapi_resources(CACHE_NAME, urls)]
+
+
+def get_planet(url, planets=None):
+    """Returns the shared < Planet > instance for a planet url. On first request the planet
+    data is retrieved with < get_swapi_resource() >, combined with the matching supplemental
+    record (if any) and passed to < create_planet() >; later requests return the same instance.
+    If the shared instance was created without < planets > (e.g., by a lazy reference), the
+    supplemental record is merged into it the first time < planets > is provided.
+
+    Parameters:
+        url (str): planet url
+        planets (dict|list): supplemental planetary data (see < index_by_name() >)
+
+    Returns:
+        Planet: shared < Planet > instance
+    """
+
+    planet = _IDENTITY_MAP.get(url)
+    if planet is None:
+        created = create_planet(get_swapi_resource(CACHE_NAME, url), planets)
+        planet = _IDENTITY_MAP.add(created)
+        if planet is created: # else another thread registered the planet first
+            if planets:
+                with _SUPPLEMENTED_LOCK:
+                    _SUPPLEMENTED[planet] = planets
+            return planet
+
+    if planets and _SUPPLEMENTED.get(planet) is not planets:
+        merged = create_planet(get_swapi_resource(CACHE_NAME, url), planets)
+        with _SUPPLEMENTED_LOCK:
+            vars(planet).update(vars(merged)) # same attributes, supplemented values
+            _SUPPLEMENTED[planet] = planets
+
+    return planet
+
+
+def get_species(url):
+    """Returns the shared < Species > instance for a species url. On first request the species
+    data is retrieved with < get_swapi_resource() > and passed to < create_species() >; later
+    requests return the same instance.
+
+    Parameters:
+        url (str): species url
+
+    Returns:
+        Species: shared < Species > instance
+    """
+
+    species = _IDENTITY_MAP.get(url)
+    if species is None:
+        species = _IDENTITY_MAP.add(create_species(get_swapi_resource(CACHE_NAME, url)))
+
+    return species
 
 
 def get_cache(filepath):
@@ -772,12 +1278,58 @@ def get_cache(filepath):
         return {}
 
 
+def get_swapi_cache(filepath, max_entries=None, max_bytes=None, ttl=None, compact=False):
+    """Returns the process-resident < SwapiCache > bound to the provided filepath, creating it
+    on first use. All callers that share a filepath, in any thread, share a single in-memory
+    cache. The storage backend is chosen by file extension: .db, .sqlite and .sqlite3 files are
+    SQLite databases (one row per entry); anything else (e.g., cache.json) is a JSON document,
+    compressed if the name ends in .gz, .bz2, .xz or .lzma (e.g., cache.json.gz).
+
+    The optional bounds, time-to-live and compact flag apply only when the cache is created;
+    later calls return the existing instance unchanged. Call < stats() > on the returned cache
+    to read its hit, miss, eviction and byte counters.
+
+    Parameters:
+        filepath (str): the path to the cache file.
+        max_entries (int): optional maximum number of resident entries (LRU eviction).
+        max_bytes (int): optional resident byte budget (LRU eviction).
+        ttl (float): optional time-to-live in seconds for new entries.
+        compact (bool): write JSON cache files without indentation.
+
+    Returns:
+        SwapiCache: resident cache instance
+    """
+
+    swapi_cache = _SWAPI_CACHES.get(filepath)
+    if swapi_cache is None:
+        with _SWAPI_CACHES_LOCK:
+            swapi_cache = _SWAPI_CACHES.get(filepath)
+            if swapi_cache is None:
+                swapi_cache = SwapiCache(
+                    open_cache_backend(filepath, compact),
+                    max_entries=max_entries,
+                    max_bytes=max_bytes,
+                    ttl=ttl
+                    )
+                _SWAPI_CACHES[filepath] = swapi_cache
+
+    return swapi_cache
+
+
 def get_swapi_resource(filepath, url, params=None, timeout=10):
     """Returns a response object decoded into a dictionary. If query string < params > are
     provide the response object body is in the form on an "envelope" with the data payload of
     one or more SWAPI entities to be found in ['results'] list; otherwise, response object
     body is returned as a single dictionary representation of the SWAPI entity.
 
+    Lookups are served by the process-resident cache bound to < filepath > (see
+    < get_swapi_cache() >). New entries are written back to the cache file in batches. Search
+    results are cached by entity url, with the search itself stored as an alias, so a later
+    by-id lookup of any entity returned by a search (e.g., a homeworld) is a cache hit. A
+    search that misses the cache is answered by the local search index if it can (see
+    < search_swapi_resources() >) before SWAPI is asked. Hits and misses are emitted as
+    instrumentation events (see swapi_metrics.py).
+
     Parameters:
         filepath (str): the path to the cache file.
         url (str): a url that specifies the resource.
@@ -788,22 +1340,308 @@ def get_swapi_resource(filepath, url, params=None, timeout=10):
         dict: dictionary representation of the decoded JSON.
     """
 
-    swapi_cache = get_cache(filepath)
+    swapi_cache = get_swapi_cache(filepath)
     cache_item_id = create_cache_item_id(url, params)
-    print(cache_item_id)
-    if cache_item_id in swapi_cache.keys():
-        return swapi_cache[cache_item_id]
+    data = swapi_cache.get(cache_item_id)
+    if data is not None:
+        if hooks:
+            emit('cache_hit')
+        return data
     else:
-        if params:
-            response = requests.get(url, params, timeout=timeout).json()
-            data = response['results'][0] # assume only one record
-        else:
-            data = requests.get(url, timeout=timeout).json()
+        if hooks:
+            emit('cache_miss')
+        if params and list(params) == ['search']:
+            results = _SEARCH_INDEX.search(url, params['search'])
+            if results:
+                if hooks:
+                    emit('search_index_hit')
+                return copy.deepcopy(results[0])
+        # Concurrent misses for the same resource share one request
+        data = _IN_FLIGHT.do(
+            (filepath, cache_item_id),
+            fetch_swapi_resource,
+            swapi_cache,
+            cache_item_id,
+            url,
+            params,
+            timeout
+            )
+        return copy.deepcopy(data) # result is shared by coalesced callers
+
+
+def fetch_swapi_resource(swapi_cache, cache_item_id, url, params=None, timeout=10):
+    """Issues an HTTP GET request for a resource that missed the cache and stores the result.
+    Search results are cached by entity url and the search key is stored as an alias.
+
+    If the cache holds a stale copy of the resource with validators, a conditional GET is sent
+    (If-None-Match / If-Modified-Since). A 304 Not Modified response renews the cached copy
+    without transferring or decoding a body.
+
+    Parameters:
+        swapi_cache (SwapiCache): cache in which to store the result
+        cache_item_id (str): cache item id of the request
+        url (str): a url that specifies the resource.
+        params (dict): optional dictionary of querystring arguments.
+        timeout (int): timeout value in seconds
+
+    Returns:
+        dict: dictionary representation of the decoded JSON.
+    """
+
+    if params:
+        response = send_swapi_request(url, params=params, timeout=timeout).json()
+
+        # Store each entity once, by url; the search key becomes an alias
+        for entity in response['results']:
+            store_swapi_entity(swapi_cache, create_cache_item_id(entity['url']), entity)
+        data = response['results'][0] # assume only one record
+        swapi_cache.set_alias(cache_item_id, create_cache_item_id(data['url']))
+    else:
+        headers = {}
+        validators = swapi_cache.get_validators(cache_item_id)
+        if validators:
+            if validators.get('etag'):
+                headers['If-None-Match'] = validators['etag']
+            if validators.get('last_modified'):
+                headers['If-Modified-Since'] = validators['last_modified']
+
+        response = send_swapi_request(url, headers=headers, timeout=timeout)
+        if response.status_code == 304:
+            data = swapi_cache.refresh(cache_item_id)
+            if data is not None:
+                return data
+            response = send_swapi_request(url, timeout=timeout) # evicted in the meantime
+
+        data = response.json()
+        store_swapi_entity(swapi_cache, cache_item_id, data, response.headers)
+
+    return data
+
+
+def send_swapi_request(url, params=None, headers=None, timeout=10):
+    """Issues an HTTP GET request on the shared session (see < get_session() >). While
+    instrumentation is enabled (see swapi_metrics.py) the request latency, status code and
+    decoded body size are emitted as an 'http_request' event.
+
+    Parameters:
+        url (str): a url that specifies the resource.
+        params (dict): optional dictionary of querystring arguments.
+        headers (dict): optional request headers
+        timeout (int): timeout value in seconds
+
+    Returns:
+        requests.Response: response
+    """
+
+    if not hooks:
+        return get_session().get(url, params=params, headers=headers, timeout=timeout)
+
+    start = time.perf_counter()
+    response = get_session().get(url, params=params, headers=headers, timeout=timeout)
+    emit(
+        'http_request',
+        seconds=time.perf_counter() - start,
+        status=str(response.status_code),
+        decoded_bytes=len(response.content)
+        )
+
+    return response
+
+
+def store_swapi_entity(swapi_cache, cache_item_id, data, headers=None):
+    """Stores a SWAPI entity together with its validators: the ETag and Last-Modified response
+    headers, if sent, and the entity's own 'edited' timestamp. If the cache already holds the
+    entity with the same 'edited' timestamp the stored copy is refreshed rather than replaced.
+    The entity is also added to the local search index.
+
+    Parameters:
+        swapi_cache (SwapiCache): cache in which to store the entity
+        cache_item_id (str): cache item id of the entity
+        data (dict): decoded SWAPI entity
+        headers (dict): optional HTTP response headers
+
+    Returns:
+        None
+    """
+
+    validators = {}
+    if headers:
+        if headers.get('ETag'):
+            validators['etag'] = headers['ETag']
+        if headers.get('Last-Modified'):
+            validators['last_modified'] = headers['Last-Modified']
+    if data.get('edited'):
+        validators['edited'] = data['edited']
+
+    _SEARCH_INDEX.add([data])
+
+    previous = swapi_cache.get_validators(cache_item_id)
+    if previous and previous.get('edited') and previous['edited'] == validators.get('edited'):
+        swapi_cache.refresh(cache_item_id, validators=validators) # unchanged
+    else:
+        swapi_cache.set(cache_item_id, data, validators=validators or None)
+
+
+def get_swapi_resources(filepath, resources, timeout=10, max_workers=MAX_WORKERS):
+    """Returns many SWAPI resources at once. Each resource is retrieved by
+    < get_swapi_resource() > on a bounded thread pool, so cache hits are served immediately,
+    misses are fetched concurrently and duplicate requests (e.g., ten people who share a
+    homeworld) are coalesced into a single fetch.
+
+    Parameters:
+        filepath (str): the path to the cache file.
+        resources (list): urls (str) or (url, params) tuples
+        timeout (int): timeout value in seconds
+        max_workers (int): maximum number of concurrent requests
+
+    Returns:
+        list: dictionary representations of the decoded JSON in < resources > order
+    """
+
+    requests_ = [
+        (resource, None) if isinstance(resource, str) else tuple(resource)
+        for resource in resources
+    ]
+    if len(requests_) < 2:
+        return [get_swapi_resource(filepath, url, params, timeout) for url, params in requests_]
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(get_swapi_resource, filepath, url, params, timeout)
+            for url, params in requests_
+        ]
+        return [future.result() for future in futures]
+
+
+def search_swapi_resources(filepath, url, search, timeout=10):
+    """Returns every entity that SWAPI returns for a ?search= query on the category at < url >
+    (case-insensitive substring of the name, or title, or starship and vehicle model), in
+    SWAPI order and across all result pages.
+
+    The search is answered locally, without a request, by the search index when the category
+    is complete in it: a snapshot of the category (see < read_snapshot() >) is indexed on first
+    use, together with every entity stored since. If the category is not complete, or nothing
+    matches (the snapshot may predate the entity), every page of results is fetched from SWAPI
+    and each entity is stored in the cache bound to < filepath >.
+
+    Parameters:
+        filepath (str): the path to the cache file.
+        url (str): category url (e.g., https://swapi.py4e.com/api/people/)
+        search (str): search term
+        timeout (int): timeout value in seconds
+
+    Returns:
+        list: dictionary representations of the matching entities
+    """
+
+    results = _SEARCH_INDEX.search(url, search)
+    if results:
+        if hooks:
+            emit('search_index_hit')
+        return copy.deepcopy(results)
+
+    swapi_cache = get_swapi_cache(filepath)
+    results = []
+    params = {'search': search}
+    while url:
+        response = send_swapi_request(url, params=params, timeout=timeout).json()
+        for entity in response['results']:
+            store_swapi_entity(swapi_cache, create_cache_item_id(entity['url']), entity)
+        results.extend(response['results'])
+        url, params = response.get('next'), None # next page url includes the search
+
+    return results
+
+
+def index_by_name(records, fields=('name',)):
+    """Builds a lookup index over supplemental records keyed by normalized field value (see
+    < normalize_name() >). Build the index once and pass it to the < create_* > factories so
+    that each merge is a single dictionary lookup rather than a scan of the records. If two
+    records share a value, the first one wins.
+
+    Parameters:
+        records (list): supplemental records (dictionaries)
+        fields (tuple): record fields to index
 
-        swapi_cache[cache_item_id] = data
-        write_json(filepath, swapi_cache)
+    Returns:
+        dict: {< field >: {< normalized value >: < record >}}
+    """
+
+    index = {field: {} for field in fields}
+    for record in records:
+        for field in fields:
+            if record.get(field):
+                index[field].setdefault(normalize_name(record[field]), record)
+
+    return index
+
+
+def load_supplemental_indexes(dirpath=''):
+    """Reads the Wookieepedia supplemental data files and returns an index for each (see
+    < index_by_name() >). Starships are indexed by model and name.
+
+    Parameters:
+        dirpath (str): directory holding the wookieepedia_< category > files
+
+    Returns:
+        dict: {'droids': < index >, 'people': < index >, 'planets': < index >,
+               'starships': < index >}
+    """
+
+    return {
+        'droids': index_by_name(read_json(os.path.join(dirpath, 'wookieepedia_droids.json'))),
+        'people': index_by_name(read_json(os.path.join(dirpath, 'wookieepedia_people.json'))),
+        'planets': index_by_name(
+            read_csv_into_dicts(os.path.join(dirpath, 'wookieepedia_planets.csv'))
+            ),
+        'starships': index_by_name(
+            read_csv_into_dicts(os.path.join(dirpath, 'wookieepedia_starships.csv')),
+            STARSHIP_MATCH_FIELDS
+            )
+    }
+
+
+def merge_supplement(data, supplements, fields=('name',)):
+    """Returns < data > combined with the supplemental record that matches it on the first of
+    < fields > with a match. Supplemental values replace source values. The caller's dictionary
+    is not modified.
+
+    Parameters:
+        data (dict): source data
+        supplements (dict|list): index built by < index_by_name() > or a list of records
+        fields (tuple): fields to match on, in order
+
+    Returns:
+        dict: combined data (< data > itself if there is no match)
+    """
+
+    if not supplements:
         return data
 
+    if isinstance(supplements, list):
+        supplements = index_by_name(supplements, fields) # legacy list argument
+
+    for field in fields:
+        if data.get(field):
+            supplement = supplements.get(field, {}).get(normalize_name(data[field]))
+            if supplement is not None:
+                return {**data, **supplement}
+
+    return data
+
+
+def normalize_name(name):
+    """Returns a matching key for a name: lowercase with runs of whitespace collapsed.
+
+    Parameters:
+        name (str): name
+
+    Returns:
+        str: normalized name
+    """
+
+    return ' '.join(str(name).lower().split())
+
 
 def read_csv_into_dicts(filepath, delimiter=','):
     """Accepts a file path, creates a file object, and returns a list of
@@ -842,23 +1680,103 @@ def read_json(filepath):
         return json.load(file_obj)
 
 
-def write_json(filepath, data):
-    """Serializes object as JSON. Writes content to the provided filepath.
+def read_snapshot(url, data_dir=SNAPSHOT_DIR):
+    """Reads the snapshot entity list (swapi_< category >.json) of the category at < url >.
+
+    Parameters:
+        url (str): category url (e.g., https://swapi.py4e.com/api/people/)
+        data_dir (str): directory holding the snapshot files
+
+    Returns:
+        list: decoded SWAPI entities or None if there is no snapshot of the category
+    """
+
+    category = urllib.parse.urlsplit(url).path.rstrip('/').rsplit('/', 1)[-1].lower()
+    path = os.path.join(data_dir, f"swapi_{category}.json")
+    if not category or not os.path.exists(path):
+        return None
+
+    return read_json(path)
+
+
+def warm_swapi_cache(filepath, data_dir=SNAPSHOT_DIR):
+    """Preloads the cache bound to < filepath > from the SWAPI snapshot files
+    (swapi_< category >.json entity lists) so that a cold start is served from local data.
+
+    Every entity is stored by url. In addition, the name (and, for starships and vehicles,
+    model) of every entity is indexed as a search: the search key is stored as an alias of the
+    entity SWAPI would return first for that term, i.e., the lowest id entity whose searchable
+    fields contain it. The snapshot categories are also marked complete in the search index
+    (see < search_swapi_resources() >).
+
+    Parameters:
+        filepath (str): the path to the cache file.
+        data_dir (str): directory holding the snapshot files
+
+    Returns:
+        int: number of entities loaded
+    """
+
+    swapi_cache = get_swapi_cache(filepath)
+
+    count = 0
+    for path in sorted(glob.glob(os.path.join(data_dir, 'swapi_*.json'))):
+        if path.endswith('_paged.json'):
+            continue
+
+        category = os.path.basename(path)[len('swapi_'):-len('.json')]
+        fields = SEARCH_FIELDS.get(category, ('name',))
+        entities = read_json(path)
+
+        for entity in entities:
+            store_swapi_entity(swapi_cache, create_cache_item_id(entity['url']), entity)
+        _SEARCH_INDEX.add(entities, complete=True)
+
+        for entity in entities:
+            category_url = entity['url'].rstrip('/').rsplit('/', 1)[0]
+            for term in [entity[field].lower() for field in fields if entity.get(field)]:
+                cache_item_id = create_cache_item_id(category_url, {'search': term})
+                first = _SEARCH_INDEX.search(category_url, term)[0]
+                swapi_cache.set_alias(cache_item_id, create_cache_item_id(first['url']))
+
+        count += len(entities)
+
+    swapi_cache.flush()
+
+    return count
+
+
+def write_json(filepath, data, compact=False):
+    """Serializes object as JSON. Writes content to the provided filepath. Entity instances
+    (e.g., a < Starship > with its crew and passengers) are streamed to the file by an
+    < EntitySerializer > rather than converted with < jsonable() > first; the output is the
+    same.
 
     Parameters:
         filepath (str): the path to the file.
-        data (dict)/(list): the data to be encoded as JSON and written to the file.
+        data (dict)/(list)/(object): the data or entity instance to be encoded as JSON and
+                                     written to the file.
+        compact (bool): write without whitespace
 
     Returns:
         None
     """
 
     with open(filepath, 'w', encoding='utf-8') as file_obj:
-        json.dump(data, file_obj, ensure_ascii=False, indent=2)
+        if hasattr(data, 'jsonable'):
+            EntitySerializer(compact).dump(data, file_obj)
+        elif compact:
+            json.dump(data, file_obj, ensure_ascii=False, separators=(',', ':'))
+        else:
+            json.dump(data, file_obj, ensure_ascii=False, indent=2)
 
 
 def main():
-    """Entry point for program."""
+    """Entry point for program. The challenges are declared as tasks that name the tasks
+    whose outputs they consume (or which must finish first because they mutate a shared
+    entity). < run_tasks() > runs independent tasks concurrently and the elapsed time of each
+    task is reported at the end.
+    """
 
     endpoint = 'https://swapi.py4e.com/api'
 
@@ -874,82 +1792,102 @@ def main():
     # filepath = 'stu_swapi_species_wookiee.json'
 
 
+    # SUPPLEMENTAL DATA (name lookups)
+
+    def load_wookiee_planets():
+        # filepath = os.path.join(abs_path, 'wookieepedia_planets.csv')
+        filepath = 'wookieepedia_planets.csv'
+        return index_by_name(read_csv_into_dicts(filepath))
+
+    def load_wookiee_droids():
+        # filepath = os.path.join(abs_path, 'wookieepedia_droids.json')
+        filepath = 'wookieepedia_droids.json'
+        return index_by_name(read_json(filepath))
+
+    def load_wookiee_people():
+        # filepath = os.path.join(abs_path, 'wookieepedia_people.json')
+        filepath = 'wookieepedia_people.json'
+        return index_by_name(read_json(filepath))
+
+    def load_wookiee_starships():
+        # filepath = os.path.join(abs_path, 'wookieepedia_starships.csv')
+        filepath = 'wookieepedia_starships.csv'
+        return index_by_name(read_csv_into_dicts(filepath), STARSHIP_MATCH_FIELDS)
+
+    def load_wookiee_star_map():
+        # filepath = os.path.join(abs_path, 'wookieepedia_star_map.json')
+        filepath = 'wookieepedia_star_map.json'
+        return read_json(filepath)
+
+
     # CHALLENGE 01 UTILITY FUNCTIONS / INHABITED PLANETS
 
     # Implement utility functions per README.md
 
-    swapi_planets_data = read_json('swapi_planets.json')
+    def write_inhabited_planets():
+        swapi_planets_data = read_json('swapi_planets.json')
 
-    inhabited_planets = []
-    for planet in swapi_planets_data:
-        if planet['population'] != 'unknown' and int(planet['population']) > 10000:
-            inhabited_planets.append(
-                {
-                    'url': planet['url'],
-                    'name': planet['name'],
-                    'population': int(planet['population'])
-                }
-            )
+        inhabited_planets = []
+        for planet in swapi_planets_data:
+            if planet['population'] != 'unknown' and int(planet['population']) > 10000:
+                inhabited_planets.append(
+                    {
+                        'url': planet['url'],
+                        'name': planet['name'],
+                        'population': int(planet['population'])
+                    }
+                )
+
+        # 39 planets returned
+        # print(f"Challenge 01: inhabited planets (pop. > 10000) = {len(inhabited_planets)}")
 
-    # 39 planets returned
-    # print(f"Challenge 01: inhabited planets (pop. > 10000) = {len(inhabited_planets)}")
+        # filepath = os.path.join(abs_path, 'stu_swapi_inhabited_planets.json')
+        filepath = 'stu_swapi_inhabited_planets.json'
+        write_json(filepath, inhabited_planets)
 
-    # filepath = os.path.join(abs_path, 'stu_swapi_inhabited_planets.json')
-    filepath = 'stu_swapi_inhabited_planets.json'
-    write_json(filepath, inhabited_planets)
 
     # CHALLENGE 02 SPECIES
-    wookiee_data = get_swapi_resource(CACHE_NAME, f"{endpoint}/species", {'search': 'wookiee'})
-    wookiee = create_species(wookiee_data)
 
-    # filepath = os.path.join(abs_path, 'stu_swapi_species_wookiee.json')
-    filepath = 'stu_swapi_species_wookiee.json'
-    write_json(filepath, wookiee.jsonable())
+    def write_wookiee():
+        wookiee_data = get_swapi_resource(CACHE_NAME, f"{endpoint}/species", {'search': 'wookiee'})
+        wookiee = create_species(wookiee_data)
 
+        # filepath = os.path.join(abs_path, 'stu_swapi_species_wookiee.json')
+        filepath = 'stu_swapi_species_wookiee.json'
+        write_json(filepath, wookiee)
 
-    # CHALLENGE 03 PLANET
-    hoth_data = get_swapi_resource(CACHE_NAME, f"{endpoint}/planets", {'search': 'hoth'})
 
-    # filepath = os.path.join(abs_path, 'wookieepedia_planets.csv')
-    filepath = 'wookieepedia_planets.csv'
-    wookiee_planets = read_csv_into_dicts(filepath)
+    # CHALLENGE 03 PLANET
 
-    hoth_data.update(wookiee_planets[5]) # combine
-    hoth = create_planet(hoth_data) # instance
+    def write_hoth(wookiee_planets):
+        hoth_data = get_swapi_resource(CACHE_NAME, f"{endpoint}/planets", {'search': 'hoth'})
+        hoth = create_planet(hoth_data, wookiee_planets) # combine, instance
 
-    # filepath = os.path.join(abs_path, 'stu_swapi_planet_hoth.json')
-    filepath = 'stu_swapi_planet_hoth.json'
-    write_json(filepath, hoth.jsonable())
+        # filepath = os.path.join(abs_path, 'stu_swapi_planet_hoth.json')
+        filepath = 'stu_swapi_planet_hoth.json'
+        write_json(filepath, hoth)
 
 
     # CHALLENGE 04 DROID
-    r2_d2_data = get_swapi_resource(CACHE_NAME, f"{endpoint}/people", {'search': 'r2-d2'})
 
-    # filepath = os.path.join(abs_path, 'wookieepedia_droids.json')
-    filepath = 'wookieepedia_droids.json'
-    wookiee_droids = read_json(filepath)
+    def write_r2_d2(wookiee_droids):
+        r2_d2_data = get_swapi_resource(CACHE_NAME, f"{endpoint}/people", {'search': 'r2-d2'})
+        r2_d2 = create_droid(r2_d2_data, wookiee_droids) # combine, instance
 
-    r2_d2_data.update(wookiee_droids[-1]) # combine
-    r2_d2 = create_droid(r2_d2_data) # instance
-
-    # filepath = os.path.join(abs_path, 'stu_swapi_droid_r2_d2.json')
-    filepath = 'stu_swapi_droid_r2_d2.json'
-    write_json(filepath, r2_d2.jsonable())
+        # filepath = os.path.join(abs_path, 'stu_swapi_droid_r2_d2.json')
+        filepath = 'stu_swapi_droid_r2_d2.json'
+        write_json(filepath, r2_d2)
 
 
     # CHALLENGE 05 PERSON
-    leia_data = get_swapi_resource(CACHE_NAME, f"{endpoint}/people", {'search': 'leia organa'})
-
-    # filepath = os.path.join(abs_path, 'wookieepedia_people.json')
-    filepath = 'wookieepedia_people.json'
-    wookiee_people = read_json(filepath)
 
-    leia_data.update(wookiee_people[4]) # combine
-    leia = create_person(leia_data, wookiee_planets) # instance
+    def write_leia(wookiee_planets, wookiee_people):
+        leia_data = get_swapi_resource(CACHE_NAME, f"{endpoint}/people", {'search': 'leia organa'})
+        leia = create_person(leia_data, wookiee_planets, wookiee_people) # combine, instance
 
-    # filepath = os.path.join(abs_path, 'stu_swapi_person_leia.json')
-    filepath = 'stu_swapi_person_leia.json'
-    write_json(filepath, leia.jsonable())
+        # filepath = os.path.join(abs_path, 'stu_swapi_person_leia.json')
+        filepath = 'stu_swapi_person_leia.json'
+        write_json(filepath, leia)
 
 
     # CHALLENGE 06 PASSENGERS
@@ -958,120 +1896,164 @@ def main():
 
 
     # CHALLENGE 07 STARSHIP
-    x_wing_data = get_swapi_resource(CACHE_NAME, f"{endpoint}/starships", {'search': 'T-70 x-wing'})
 
-    # filepath = os.path.join(abs_path, 'wookieepedia_starships.csv')
-    filepath = 'wookieepedia_starships.csv'
-    wookiee_starships = read_csv_into_dicts(filepath)
+    def write_x_wing(wookiee_starships):
+        x_wing_data = get_swapi_resource(
+            CACHE_NAME, f"{endpoint}/starships", {'search': 'T-70 x-wing'}
+            )
+        x_wing = create_starship(x_wing_data, wookiee_starships) # combine, instance
 
-    x_wing_data.update(wookiee_starships[1]) # combine
-    x_wing = create_starship(x_wing_data) # instance
+        # filepath = os.path.join(abs_path, 'stu_swapi_starship_x_wing.json')
+        filepath = 'stu_swapi_starship_x_wing.json'
+        write_json(filepath, x_wing)
 
-    # filepath = os.path.join(abs_path, 'stu_swapi_starship_x_wing.json')
-    filepath = 'stu_swapi_starship_x_wing.json'
-    write_json(filepath, x_wing.jsonable())
+        return x_wing
 
 
     # CHALLENGE 08 MISSION TO JAKKU
-    poe_data = get_swapi_resource(CACHE_NAME, f"{endpoint}/people", {'search': 'poe'})
-    poe_data.update(wookiee_people[7])
-    poe = create_person(poe_data, wookiee_planets)
-
-    bb8_data = get_swapi_resource(CACHE_NAME, f"{endpoint}/people", {'search': 'bb8'})
-    bb8_data.update(wookiee_droids[0])
-    bb8 = create_droid(bb8_data)
-
-    # Special instructions: get Jakku data and clean
-    jakku_data = get_swapi_resource(CACHE_NAME, f"{endpoint}/planets", {'search': 'jakku'})
-    jakku_data.update(wookiee_planets[7])
-    jakku = create_planet(jakku_data)
-
-    # Create "flight_plan" instructions (nested dict) and store in BB8
-    flight_plan = {
-        'flight_plan': {
-            'destination': jakku.jsonable(), # dict representation
-            'hyperspace_route': "Burke's Trailing",
-            'year': "34 ABY"
-            }
-        }
 
-    # Store flight plan
-    bb8.store_instructions(flight_plan)
+    def create_poe(wookiee_planets, wookiee_people):
+        poe_data = get_swapi_resource(CACHE_NAME, f"{endpoint}/people", {'search': 'poe'})
+        return create_person(poe_data, wookiee_planets, wookiee_people)
+
+    def create_bb8(wookiee_droids):
+        bb8_data = get_swapi_resource(CACHE_NAME, f"{endpoint}/people", {'search': 'bb8'})
+        return create_droid(bb8_data, wookiee_droids)
+
+    def create_jakku(wookiee_planets):
+        # Special instructions: get Jakku data and clean
+        jakku_data = get_swapi_resource(CACHE_NAME, f"{endpoint}/planets", {'search': 'jakku'})
+        return create_planet(jakku_data, wookiee_planets)
+
+    def create_lor(wookiee_planets, wookiee_people):
+        # Create "locate_person" Lor San Tekka instructions (nested dict)
+        lor_data = wookiee_people['name'][normalize_name('Lor San Tekka')]
+        return create_person(lor_data, wookiee_planets)
+
+    def write_mission_jakku(x_wing, poe, bb8, jakku, lor):
+        # Create "flight_plan" instructions (nested dict) and store in BB8
+        flight_plan = {
+            'flight_plan': {
+                'destination': jakku.jsonable(), # dict representation
+                'hyperspace_route': "Burke's Trailing",
+                'year': "34 ABY"
+                }
+            }
 
-    # Create "locate_person" Lor San Tekka instructions (nested dict)
-    lor_data = wookiee_people[6]
-    lor = create_person(lor_data, wookiee_planets)
+        # Store flight plan
+        bb8.store_instructions(flight_plan)
 
-    # Create locate_person dict and store instructions
-    bb8.store_instructions({'locate_person': lor.jsonable()})
+        # Create locate_person dict and store instructions
+        bb8.store_instructions({'locate_person': lor.jsonable()})
 
-    x_wing_crew = Crew({'pilot': poe, 'astro_mech_droid': bb8})
-    x_wing.assign_crew_members(x_wing_crew)
+        x_wing_crew = Crew({'pilot': poe, 'astro_mech_droid': bb8})
+        x_wing.assign_crew_members(x_wing_crew)
 
-    # filepath = os.path.join(abs_path, 'stu_episode_vii_mission_jakku.json')
-    filepath = 'stu_episode_vii_mission_jakku.json'
-    write_json(filepath, x_wing.jsonable())
+        # filepath = os.path.join(abs_path, 'stu_episode_vii_mission_jakku.json')
+        filepath = 'stu_episode_vii_mission_jakku.json'
+        write_json(filepath, x_wing)
 
 
     # CHALLENGE 09 STAR MAP (ATTACK ON TUANUL)
-    # filepath = os.path.join(abs_path, 'wookieepedia_star_map.json')
-    filepath = 'wookieepedia_star_map.json'
-    wookiee_star_map = read_json(filepath)
 
-    # Create map dict and store
-    bb8.store_instructions({'star_map': wookiee_star_map})
+    def write_star_map(bb8, wookiee_star_map):
+        # Create map dict and store
+        bb8.store_instructions({'star_map': wookiee_star_map})
 
-    # filepath = os.path.join(abs_path, 'stu_episode_vii_star_map.json')
-    filepath = 'stu_episode_vii_star_map.json'
-    write_json(filepath, bb8.jsonable())
+        # filepath = os.path.join(abs_path, 'stu_episode_vii_star_map.json')
+        filepath = 'stu_episode_vii_star_map.json'
+        write_json(filepath, bb8)
 
 
     # CHALLENGE 10 ESCAPE FROM JAKKU
-    rey_data = get_swapi_resource(CACHE_NAME, f"{endpoint}/people", {'search': 'rey'})
-    rey_data.update(wookiee_people[-1])
-    rey = create_person(rey_data, wookiee_planets)
 
-    finn_data = get_swapi_resource(CACHE_NAME, f"{endpoint}/people", {'search': 'finn'})
-    finn_data.update(wookiee_people[1])
-    finn = create_person(finn_data, wookiee_planets)
+    def create_rey(wookiee_planets, wookiee_people):
+        rey_data = get_swapi_resource(CACHE_NAME, f"{endpoint}/people", {'search': 'rey'})
+        return create_person(rey_data, wookiee_planets, wookiee_people)
 
-    m_falcon_data = get_swapi_resource(CACHE_NAME, f"{endpoint}/starships", {'search': 'falcon'})
-    m_falcon_data.update(wookiee_starships[-1])
-    m_falcon = create_starship(m_falcon_data)
+    def create_finn(wookiee_planets, wookiee_people):
+        finn_data = get_swapi_resource(CACHE_NAME, f"{endpoint}/people", {'search': 'finn'})
+        return create_person(finn_data, wookiee_planets, wookiee_people)
 
-    # Assign crew
-    m_falcon_crew = Crew({'pilot': rey, 'gunner': finn})
-    m_falcon.assign_crew_members(m_falcon_crew)
-
-    # Assign passengers
-    m_falcon_passengers = Passengers([bb8])
-    m_falcon.add_passengers(m_falcon_passengers)
+    def create_m_falcon(wookiee_starships):
+        m_falcon_data = get_swapi_resource(
+            CACHE_NAME, f"{endpoint}/starships", {'search': 'falcon'}
+            )
+        return create_starship(m_falcon_data, wookiee_starships)
 
-    # filepath = os.path.join(abs_path, 'stu_episode_vii_escape_jakku.json')
-    filepath = 'stu_episode_vii_escape_jakku.json'
-    write_json(filepath, m_falcon.jsonable())
+    def write_escape_jakku(m_falcon, rey, finn, bb8):
+        # Assign crew
+        m_falcon_crew = Crew({'pilot': rey, 'gunner': finn})
+        m_falcon.assign_crew_members(m_falcon_crew)
 
+        # Assign passengers
+        m_falcon_passengers = Passengers([bb8])
+        m_falcon.add_passengers(m_falcon_passengers)
 
-    # CHALLENGE 11 JOURNEY TO TAKODANA
-    han_solo_data = get_swapi_resource(CACHE_NAME, f"{endpoint}/people", {'search': 'han solo'})
-    han_solo_data.update(wookiee_people[2])
-    han_solo = create_person(han_solo_data, wookiee_planets)
+        # filepath = os.path.join(abs_path, 'stu_episode_vii_escape_jakku.json')
+        filepath = 'stu_episode_vii_escape_jakku.json'
+        write_json(filepath, m_falcon)
 
-    chewie_data = get_swapi_resource(CACHE_NAME, f"{endpoint}/people", {'search': 'chewbacca'})
-    chewie_data.update(wookiee_people[0])
-    chewie = create_person(chewie_data, wookiee_planets)
 
-    # Reassign crew
-    m_falcon_crew = Crew({'pilot': han_solo, 'copilot': chewie})
-    m_falcon.assign_crew_members(m_falcon_crew)
+    # CHALLENGE 11 JOURNEY TO TAKODANA
 
-    # Reassign passengers
-    m_falcon_passengers = Passengers([rey, finn, bb8])
-    m_falcon.add_passengers(m_falcon_passengers)
+    def create_han_solo(wookiee_planets, wookiee_people):
+        han_solo_data = get_swapi_resource(CACHE_NAME, f"{endpoint}/people", {'search': 'han solo'})
+        return create_person(han_solo_data, wookiee_planets, wookiee_people)
+
+    def create_chewie(wookiee_planets, wookiee_people):
+        chewie_data = get_swapi_resource(CACHE_NAME, f"{endpoint}/people", {'search': 'chewbacca'})
+        return create_person(chewie_data, wookiee_planets, wookiee_people)
+
+    def write_journey_takodana(m_falcon, han_solo, chewie, rey, finn, bb8):
+        # Reassign crew
+        m_falcon_crew = Crew({'pilot': han_solo, 'copilot': chewie})
+        m_falcon.assign_crew_members(m_falcon_crew)
+
+        # Reassign passengers
+        m_falcon_passengers = Passengers([rey, finn, bb8])
+        m_falcon.add_passengers(m_falcon_passengers)
+
+        # filepath = os.path.join(abs_path, 'stu_episode_vii_journey_takodana.json')
+        filepath = 'stu_episode_vii_journey_takodana.json'
+        write_json(filepath, m_falcon)
+
+
+    # Tasks: name, function, inputs (outputs of other tasks), after (ordering only)
+    tasks = [
+        Task('wookiee_planets', load_wookiee_planets),
+        Task('wookiee_droids', load_wookiee_droids),
+        Task('wookiee_people', load_wookiee_people),
+        Task('wookiee_starships', load_wookiee_starships),
+        Task('wookiee_star_map', load_wookiee_star_map),
+        Task('inhabited_planets', write_inhabited_planets), # 01
+        Task('wookiee', write_wookiee), # 02
+        Task('hoth', write_hoth, ['wookiee_planets']), # 03
+        Task('r2_d2', write_r2_d2, ['wookiee_droids']), # 04
+        Task('leia', write_leia, ['wookiee_planets', 'wookiee_people']), # 05
+        Task('x_wing', write_x_wing, ['wookiee_starships']), # 07
+        Task('poe', create_poe, ['wookiee_planets', 'wookiee_people']), # 08
+        Task('bb8', create_bb8, ['wookiee_droids']),
+        Task('jakku', create_jakku, ['wookiee_planets']),
+        Task('lor', create_lor, ['wookiee_planets', 'wookiee_people']),
+        Task('mission_jakku', write_mission_jakku, ['x_wing', 'poe', 'bb8', 'jakku', 'lor']),
+        Task('star_map', write_star_map, ['bb8', 'wookiee_star_map'], ['mission_jakku']), # 09
+        Task('rey', create_rey, ['wookiee_planets', 'wookiee_people']), # 10
+        Task('finn', create_finn, ['wookiee_planets', 'wookiee_people']),
+        Task('m_falcon', create_m_falcon, ['wookiee_starships']),
+        Task('escape_jakku', write_escape_jakku, ['m_falcon', 'rey', 'finn', 'bb8'], ['star_map']),
+        Task('han_solo', create_han_solo, ['wookiee_planets', 'wookiee_people']), # 11
+        Task('chewie', create_chewie, ['wookiee_planets', 'wookiee_people']),
+        Task(
+            'journey_takodana',
+            write_journey_takodana,
+            ['m_falcon', 'han_solo', 'chewie', 'rey', 'finn', 'bb8'],
+            ['escape_jakku']
+            )
+    ]
 
-    # filepath = os.path.join(abs_path, 'stu_episode_vii_journey_takodana.json')
-    filepath = 'stu_episode_vii_journey_takodana.json'
-    write_json(filepath, m_falcon.jsonable())
+    timings = run_tasks(tasks, MAX_WORKERS)[1]
+    print(format_timings(timings))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,156 @@
+import concurrent.futures
+import time
+
+MAX_WORKERS = 4 # tasks run concurrently by run_tasks()
+
+
+class Task:
+    """A named unit of work in a dependency graph (see < run_tasks() >). The task's inputs are
+    the outputs (return values) of other tasks; each is passed to < func > as a keyword
+    argument named after the task that produced it. Tasks listed in < after > must also finish
+    first, but their outputs are not passed (e.g., because they mutate a shared entity).
+
+    Attributes:
+        name (str): task name (a valid Python identifier)
+        func (function): callable run with the input tasks' outputs as keyword arguments
+        inputs (tuple): names of the tasks whose outputs this task consumes
+        after (tuple): names of other tasks that must finish first
+        requires (tuple): inputs and after combined
+
+    Methods:
+        run: call < func > and time it
+    """
+
+    def __init__(self, name, func, inputs=(), after=()):
+        """Initialize a Task instance."""
+
+        self.name = name
+        self.func = func
+        self.inputs = tuple(inputs)
+        self.after = tuple(after)
+        self.requires = self.inputs + self.after
+
+    def __str__(self):
+        """Return a string representation of the object."""
+
+        return self.name
+
+    def run(self, inputs):
+        """Call the task function with its inputs.
+
+        Parameters:
+            inputs (dict): input task outputs keyed by task name
+
+        Returns:
+            tuple: (output, start time, elapsed seconds) per < time.perf_counter() >
+        """
+
+        start = time.perf_counter()
+        output = self.func(**inputs)
+
+        return output, start, time.perf_counter() - start
+
+
+def format_timings(timings):
+    """Returns a per-task timing report, ordered by start time.
+
+    Parameters:
+        timings (dict): {< task name >: (start offset, elapsed seconds)} (see < run_tasks() >)
+
+    Returns:
+        str: report lines
+    """
+
+    width = max([len(name) for name in timings] + [4])
+    lines = [f"{'task':<{width}}  {'start':>8}  {'seconds':>8}"]
+    for name, (start, elapsed) in sorted(timings.items(), key=lambda item: item[1][0]):
+        lines.append(f"{name:<{width}}  {start:>8.3f}  {elapsed:>8.3f}")
+
+    return '\n'.join(lines)
+
+
+def order_tasks(tasks):
+    """Validates a task graph and returns its tasks in a dependency-respecting order.
+
+    Parameters:
+        tasks (list): < Task > instances
+
+    Returns:
+        list: < Task > instances, each after the tasks it requires
+
+    Raises:
+        ValueError: duplicate task name, unknown required task or dependency cycle
+    """
+
+    graph = {}
+    for task in tasks:
+        if task.name in graph:
+            raise ValueError(f"Duplicate task: {task.name}")
+        graph[task.name] = task
+
+    for task in tasks:
+        for name in task.requires:
+            if name not in graph:
+                raise ValueError(f"Task {task.name} requires unknown task {name}")
+
+    ordered = []
+    done = set()
+    pending = list(tasks)
+    while pending:
+        ready = [task for task in pending if done.issuperset(task.requires)]
+        if not ready:
+            names = ', '.join([task.name for task in pending])
+            raise ValueError(f"Dependency cycle among tasks: {names}")
+
+        for task in ready:
+            ordered.append(task)
+            done.add(task.name)
+        pending = [task for task in pending if task.name not in done]
+
+    return ordered
+
+
+def run_tasks(tasks, max_workers=MAX_WORKERS):
+    """Runs a task graph on a thread pool. A task is started as soon as every task it requires
+    has finished, so independent tasks overlap; at most < max_workers > tasks run at once. If
+    a task raises, no further tasks are started and the exception is re-raised once the
+    running tasks have finished.
+
+    Parameters:
+        tasks (list): < Task > instances
+        max_workers (int): maximum number of concurrently running tasks
+
+    Returns:
+        tuple: (outputs, timings) where outputs is {< task name >: < output >} and timings is
+               {< task name >: (start offset, elapsed seconds)} relative to the start of the run
+    """
+
+    waiting = {task.name: task for task in order_tasks(tasks)}
+    outputs = {}
+    timings = {}
+    origin = time.perf_counter()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        running = {}
+
+        def submit_ready():
+            for name, task in list(waiting.items()):
+                if all(required in outputs for required in task.requires):
+                    del waiting[name]
+                    inputs = {key: outputs[key] for key in task.inputs}
+                    running[executor.submit(task.run, inputs)] = name
+
+        submit_ready()
+        while running:
+            done, _ = concurrent.futures.wait(
+                running, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+            for future in done:
+                name = running.pop(future)
+                output, start, elapsed = future.result() # re-raises a task's exception
+                outputs[name] = output
+                timings[name] = (start - origin, elapsed)
+
+            submit_ready()
+
+    return outputs, timings
@@ -0,0 +1,33 @@
+import argparse
+import time
+
+from swapi_solution import CACHE_NAME, SNAPSHOT_DIR, get_swapi_cache, warm_swapi_cache
+
+
+def main():
+    """Preload a SWAPI cache from the snapshot files written by recursive_functions/swapi_data.py.
+    Usage:
+
+        python warm_cache.py
+        python warm_cache.py --cache cache.sqlite --data-dir ../recursive_functions/swapi_data
+        python warm_cache.py --cache cache.json.gz
+    """
+
+    parser = argparse.ArgumentParser(description='Warm a SWAPI cache from local snapshot files')
+    parser.add_argument('--cache', default=CACHE_NAME, help='cache file (.json or .sqlite)')
+    parser.add_argument('--data-dir', default=SNAPSHOT_DIR, help='snapshot directory')
+    parser.add_argument('--compact', action='store_true', help='write JSON without whitespace')
+    args = parser.parse_args()
+
+    get_swapi_cache(args.cache, compact=args.compact)
+    start = time.perf_counter()
+    count = warm_swapi_cache(args.cache, args.data_dir)
+    elapsed = time.perf_counter() - start
+
+    stats = get_swapi_cache(args.cache).stats()
+    print(f"Loaded {count} entities ({stats['entries']} cache entries) into {args.cache} "
+          f"in {elapsed:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,11 +1,24 @@
+import argparse
+import collections
+import concurrent.futures
+import itertools
 import json
 import logging
+import math
 import os
-import requests
+import tempfile
+import urllib.parse
+from swapi_http import configure_session, get_session
+from swapi_throttle import MAX_CONCURRENCY, AimdLimiter, Throttle, TokenBucket
 
 FILE_PATH = os.path.dirname(os.path.abspath(__file__))  # Windows friendly
 ENDPOINT = 'https://swapi.py4e.com/api'
+MANIFEST_NAME = 'swapi_manifest.json' # page ETags and entity 'edited' timestamps (see sync())
+MANIFEST_VERSION = 1
+MAX_WORKERS = 8 # concurrent page requests issued by get_records_concurrently()
+NDJSON_EXTENSIONS = ('.jsonl', '.ndjson') # write_json_stream() writes one item per line
 OUTPUT_DIR = 'swapi_data/'
+RATE = 10.0 # requests per second across all categories (token bucket, see configure_throttle())
 
 SWAPI = {
     'films': (
@@ -40,8 +53,245 @@ SWAPI = {
      )
 }
 
+_THROTTLE = None # shared by every request once configure_throttle() is called
 
-def get_records_recursively(uri, records=[], paged=False):
+
+class JsonSink:
+    """Incremental JSON file writer: items are encoded and written one at a time, so that only
+    the current item is held in memory. Files ending in .jsonl or .ndjson receive one compact
+    JSON document per line (NDJSON); any other file receives a JSON array formatted exactly as
+    < write_json() > would format the list of items.
+
+    Items are written to a temporary file in the same directory which replaces < path > when
+    the sink is closed, so a crawl that fails midway leaves the previous file intact. Used as a
+    context manager the sink is closed on success and aborted if an exception is raised. Once
+    closed or aborted, further calls to < close() > and < abort() > do nothing.
+
+    Attributes:
+        path (str): the file path
+        ndjson (bool): write one item per line
+        count (int): number of items written
+
+    Methods:
+        write: encode and write an item
+        close: finish the file and replace < path > with it
+        abort: discard the temporary file
+    """
+
+    def __init__(self, path):
+        """Initialize a JsonSink instance. Creates the temporary file."""
+
+        self.path = path
+        self.ndjson = os.path.splitext(path)[1].lower() in NDJSON_EXTENSIONS
+        self.count = 0
+        directory, name = os.path.split(os.path.abspath(path))
+        fd, self._temp_path = tempfile.mkstemp(prefix=f".{name}.", suffix='.tmp', dir=directory)
+        self._file_obj = open(fd, 'w', encoding='utf8')
+
+    def __enter__(self):
+        """Return the sink."""
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close the sink, or abort it if an exception was raised."""
+
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def write(self, item):
+        """Encode and write an item.
+
+        Parameters:
+            item (dict): the data to be encoded as JSON
+
+        Returns:
+            None
+        """
+
+        if self.ndjson:
+            self._file_obj.write(json.dumps(item, ensure_ascii=False) + '\n')
+        else:
+            text = json.dumps(item, ensure_ascii=False, indent=2).replace('\n', '\n  ')
+            self._file_obj.write((',\n  ' if self.count else '[\n  ') + text)
+        self.count += 1
+
+    def close(self):
+        """Finish the file and atomically replace < path > with it.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+
+        if self._file_obj.closed:
+            return # already closed or aborted
+
+        try:
+            if not self.ndjson:
+                self._file_obj.write('\n]' if self.count else '[]')
+            self._file_obj.close()
+            os.chmod(self._temp_path, 0o644) # mkstemp() creates files readable by owner only
+            os.replace(self._temp_path, self.path)
+        except BaseException:
+            self.abort()
+            raise
+
+    def abort(self):
+        """Discard the temporary file, leaving < path > untouched.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+
+        self._file_obj.close()
+        if os.path.exists(self._temp_path):
+            os.remove(self._temp_path)
+
+
+def crawl(uri, page_sinks=(), record_sinks=(), max_workers=MAX_WORKERS):
+    """Crawls a paged resource once, fanning the page stream out to several sinks: each page
+    is written to every page sink and each of its entities to every record sink (e.g., the
+    swapi_< category >_paged.json and swapi_< category >.json snapshots), so producing both
+    costs a single crawl. Pages are fetched as by < iter_pages() > and only the current page
+    is held once it has been written.
+
+    Parameters:
+        uri (str): a url that specifies the resource.
+        page_sinks (list): sinks (see < JsonSink >) that receive each page
+        record_sinks (list): sinks that receive each entity
+        max_workers (int): maximum number of pages requested ahead
+
+    Returns:
+        tuple: (number of pages, number of entities)
+    """
+
+    pages = records = 0
+    for page in iter_pages(uri, max_workers):
+        for sink in page_sinks:
+            sink.write(page)
+        for record in page['results']:
+            for sink in record_sinks:
+                sink.write(record)
+        pages += 1
+        records += len(page['results'])
+
+    logging.info("{} {} pages, {} entities written".format(uri, pages, records))
+
+    return pages, records
+
+
+def configure_throttle(rate=RATE, burst=None, max_concurrency=MAX_CONCURRENCY):
+    """Routes every SWAPI request through a shared < Throttle >: a global token bucket bounds
+    the request rate across all threads and categories, and an AIMD limiter adapts the number
+    of requests in flight to the latency and overload (429/5xx) responses observed. The shared
+    session's own status retries are turned off so that overload responses reach the limiter,
+    which backs off and retries them itself.
+
+    Parameters:
+        rate (float): requests per second (None = no rate limit)
+        burst (int): requests that may be sent at once (default: one second's worth)
+        max_concurrency (int): upper bound of the adaptive concurrency limit
+
+    Returns:
+        Throttle: the shared throttle
+    """
+
+    global _THROTTLE
+
+    bucket = TokenBucket(rate, burst) if rate else None
+    limiter = AimdLimiter(
+        limit=min(MAX_WORKERS, max_concurrency), max_limit=max_concurrency
+        )
+    configure_session(status_forcelist=())
+    _THROTTLE = Throttle(bucket, limiter)
+
+    return _THROTTLE
+
+
+def crawl_categories(categories=None, max_workers=MAX_WORKERS):
+    """Crawls SWAPI categories in parallel, writing the paged and entity snapshot files of each
+    in a single pass (see < crawl() >). Each category runs in its own thread and requests up to
+    < max_workers > pages ahead; the number of requests actually in flight, and their rate, are
+    governed by the shared throttle if one is configured (see < configure_throttle() >).
+
+    Parameters:
+        categories (list): keys of SWAPI to crawl (default: all)
+        max_workers (int): maximum number of pages requested ahead per category
+
+    Returns:
+        dict: {< category >: (number of pages, number of entities)}
+    """
+
+    def crawl_category(key):
+        val = SWAPI[key]
+        paged_path = os.path.join(FILE_PATH, OUTPUT_DIR, val[1])  # Windows friendly
+        entity_path = os.path.join(FILE_PATH, OUTPUT_DIR, val[2])
+        with JsonSink(paged_path) as page_sink, JsonSink(entity_path) as record_sink:
+            return crawl(val[0], [page_sink], [record_sink], max_workers)
+
+    categories = list(categories or SWAPI)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(categories)) as executor:
+        return dict(zip(categories, executor.map(crawl_category, categories)))
+
+
+def create_page_url(url, number):
+    """Returns < url > with its 'page' querystring argument set to < number >. Other arguments
+    (e.g., 'search') are kept.
+
+    Parameters:
+        url (str): url of a page of a paged resource (e.g., the 'next' link of page 1)
+        number (int): page number
+
+    Returns:
+        str: page url
+    """
+
+    parts = urllib.parse.urlsplit(url)
+    args = dict(urllib.parse.parse_qsl(parts.query))
+    args['page'] = str(number)
+
+    return urllib.parse.urlunsplit(parts._replace(query=urllib.parse.urlencode(args)))
+
+
+def get_records_concurrently(uri, paged=False, max_workers=MAX_WORKERS):
+    """Returns list of resources acquired by fetching the first page and then every remaining
+    page at once. The first page reports the total record 'count', from which the number of
+    pages and their urls (?page=N) are known, so the remaining pages are requested concurrently
+    on a bounded thread pool instead of one after another by following 'next' links (see
+    < iter_pages() >). Pages are returned in their original order.
+
+    Parameters:
+        uri (str): a url that specifies the resource.
+        paged: (bool): optional flag that how the response is to be returned.
+        max_workers (int): maximum number of concurrent page requests
+
+    Returns:
+        list: collection of paged or entity resources.
+    """
+
+    pages = list(iter_pages(uri, max_workers))
+
+    if paged:
+        logging.info("{} {} pages appended to list".format(uri, len(pages)))
+        return pages
+
+    records = []
+    for page in pages:
+        records.extend(page['results'])
+    logging.info("{} {} entities added to list".format(uri, len(records)))
+
+    return records
+
+
+def get_records_recursively(uri, records=None, paged=False):
     """Returns list of resources acquired recursively. Calls get_resource_json(uri) to return a
     representation of the resource.  State is maintained internally by passing the records list
     back to the function whenever it is called. Records can be returned either as a paged object or
@@ -49,13 +299,16 @@ def get_records_recursively(uri, records=[], paged=False):
 
     Parameters:
         uri (str): a url that specifies the resource.
-        records (list): collection of paged or entity resources.
+        records (list): optional collection of paged or entity resources to extend.
         paged: (bool): optional flag that how the response is to be returned.
 
     Return:
         list: collection of paged or entity resources.
     """
 
+    if records is None:
+        records = [] # a default list would be shared by every call
+
     response = get_resource_json(uri)
 
     if paged:
@@ -71,7 +324,7 @@ def get_records_recursively(uri, records=[], paged=False):
         return get_records_recursively(response['next'], records, paged)
 
 
-def get_resource_json(url, params=None):
+def get_resource_json(url, params=None, timeout=10):
     """Issues an HTTP GET request to return a representation of a resource.
     If no category is provided, the root resource will be returned. An optional
     querystring of key:value pairs may be provided as search terms. If a match is
@@ -81,19 +334,41 @@ def get_resource_json(url, params=None):
     Parameters:
         url (str): a url that specifies the resource.
         params (dict): optional dictionary of querystring arguments (e.g., {'search': 'yoda'}).
+        timeout (int): timeout value in seconds
 
     Returns:
         dict: dictionary representation of the decoded JSON.
     """
 
-    if params:
-        response = requests.get(url, params=params).json()
-    else:
-        response = requests.get(url).json()
+    # Shared session: pooled keep-alive connections, retries with backoff
+    response = send_request(url, params=params, timeout=timeout).json()
 
     return response
 
 
+def get_resource_json_if_modified(url, etag=None, timeout=10):
+    """Issues an HTTP GET request to return a representation of a resource unless it is
+    unchanged. If the < etag > of a copy held from an earlier request is provided the request
+    is conditional (If-None-Match); a 304 Not Modified response carries no body.
+
+    Parameters:
+        url (str): a url that specifies the resource.
+        etag (str): optional ETag of the copy already held
+        timeout (int): timeout value in seconds
+
+    Returns:
+        tuple: (dictionary representation of the decoded JSON or None if not modified, ETag of
+               the current representation or None if the server sends none)
+    """
+
+    headers = {'If-None-Match': etag} if etag else None
+    response = send_request(url, headers=headers, timeout=timeout)
+    if response.status_code == 304:
+        return None, response.headers.get('ETag', etag)
+
+    return response.json(), response.headers.get('ETag')
+
+
 def get_resource_json_by_id(url):
     """Given a url that specifies a known resource identifier (e.g., '/people/1/')
     issue an HTTP GET request to return a representation of a resource. This function
@@ -111,6 +386,248 @@ def get_resource_json_by_id(url):
     return response
 
 
+def iter_page_versions(uri, known=None, max_workers=MAX_WORKERS):
+    """Yields the pages of a paged resource in order, as they arrive (see < iter_pages() >),
+    together with their url and ETag. Pages already held from an earlier crawl may be passed
+    in < known >: each is requested conditionally (If-None-Match) and, if the server reports
+    it unchanged (304 Not Modified), the known page is yielded instead of a new download.
+
+    Parameters:
+        uri (str): a url that specifies the resource.
+        known (dict): optional {< page url >: (ETag, page)} from an earlier crawl
+        max_workers (int): maximum number of pages requested ahead
+
+    Yields:
+        tuple: (page url, page, ETag or None, True if the page was downloaded)
+
+    Raises:
+        requests.HTTPError: a page request failed (see < send_request() >)
+        LookupError: a page was not found although a later page exists
+    """
+
+    known = known or {}
+
+    def fetch(url):
+        etag, page = known.get(url, (None, None))
+        data, etag = get_resource_json_if_modified(url, etag if page is not None else None)
+        if data is None:
+            return url, page, etag, False
+        return url, data, etag, True
+
+    version = fetch(uri)
+    page = version[1]
+    logging.info("{} page 1 of a count of {}".format(uri, page.get('count')))
+    yield version
+
+    size = len(page['results'])
+    if page['next'] and size:
+        urls = (
+            create_page_url(page['next'], number)
+            for number in range(2, math.ceil(page['count'] / size) + 1)
+        )
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            window = collections.deque(
+                [executor.submit(fetch, url) for url in itertools.islice(urls, max_workers)]
+                )
+            missing = None # first page not found, i.e., past the end if the resource shrank
+            while window:
+                version = window.popleft().result()
+                for url in itertools.islice(urls, 1):
+                    window.append(executor.submit(fetch, url))
+                if 'results' not in version[1]: # 404 {'detail': 'Not found'}
+                    missing = missing or version[0]
+                elif missing:
+                    raise LookupError(f"{missing} not found but {version[0]} exists")
+                else:
+                    page = version[1]
+                    yield version
+
+    while page.get('next'): # added since page 1 was read
+        version = fetch(page['next'])
+        page = version[1]
+        if 'results' not in page:
+            break
+        yield version
+
+
+def iter_pages(uri, max_workers=MAX_WORKERS):
+    """Yields the pages of a paged resource in order, as they arrive. The first page reports
+    the total record 'count', from which the urls of the remaining pages (?page=N) are known;
+    up to < max_workers > of them are requested ahead of the page being yielded. At most
+    < max_workers > + 1 pages are held at once however large the resource is; with
+    < max_workers > set to 1 pages are fetched one at a time.
+
+    If the resource grew while it was being read, any pages beyond the last one predicted are
+    then followed by their 'next' links; if it shrank, predicted pages past its new end (404 Not
+    Found) are skipped. Any other error response raises < requests.HTTPError > (see
+    < send_request() >), so that a partial crawl is never mistaken for a complete one.
+
+    Parameters:
+        uri (str): a url that specifies the resource.
+        max_workers (int): maximum number of pages requested ahead
+
+    Yields:
+        dict: page (SWAPI envelope with 'count', 'next', 'previous' and 'results')
+    """
+
+    for url, page, etag, modified in iter_page_versions(uri, max_workers=max_workers):
+        yield page
+
+
+def iter_records(uri, max_workers=MAX_WORKERS):
+    """Yields the entities of a paged resource in order, page by page (see < iter_pages() >).
+
+    Parameters:
+        uri (str): a url that specifies the resource.
+        max_workers (int): maximum number of pages requested ahead
+
+    Yields:
+        dict: entity
+    """
+
+    for page in iter_pages(uri, max_workers):
+        yield from page['results']
+
+
+def send_request(url, params=None, headers=None, timeout=10):
+    """Issues an HTTP GET request on the shared session, through the shared throttle if one is
+    configured (see < configure_throttle() >).
+
+    Parameters:
+        url (str): a url that specifies the resource.
+        params (dict): optional dictionary of querystring arguments
+        headers (dict): optional request headers
+        timeout (int): timeout value in seconds
+
+    Returns:
+        requests.Response: response (including 304 Not Modified and 404 Not Found responses)
+
+    Raises:
+        requests.HTTPError: any other error response, e.g., a 429 or 503 still returned once
+                            the session's and the throttle's retries are used up
+    """
+
+    if _THROTTLE is None:
+        response = get_session().get(url, params=params, headers=headers, timeout=timeout)
+    else:
+        response = _THROTTLE.call(
+            get_session().get, url, params=params, headers=headers, timeout=timeout
+            )
+
+    if response.status_code != 404: # a missing entity or page is reported by its JSON body
+        response.raise_for_status()
+
+    return response
+
+
+def sync(manifest_path=None, max_workers=MAX_WORKERS):
+    """Brings the snapshot files of every SWAPI category up to date incrementally (see
+    < sync_category() >) and rewrites the manifest. Categories are synced in parallel. Without
+    a manifest (e.g., on the first run) every category is crawled in full and the manifest is
+    created.
+
+    Parameters:
+        manifest_path (str): optional manifest file path (default: swapi_data/ + MANIFEST_NAME)
+        max_workers (int): maximum number of pages requested ahead
+
+    Returns:
+        dict: change counts per category (see < sync_category() >)
+    """
+
+    if manifest_path is None:
+        manifest_path = os.path.join(FILE_PATH, OUTPUT_DIR, MANIFEST_NAME)
+
+    try:
+        with open(manifest_path, 'r', encoding='utf8') as file_obj:
+            manifest = json.load(file_obj)
+    except (OSError, ValueError):
+        manifest = {}
+    if manifest.get('format') != MANIFEST_VERSION:
+        manifest = {'format': MANIFEST_VERSION, 'categories': {}}
+
+    def sync_key(key):
+        val = SWAPI[key]
+        paged_path = os.path.join(FILE_PATH, OUTPUT_DIR, val[1])  # Windows friendly
+        entity_path = os.path.join(FILE_PATH, OUTPUT_DIR, val[2])
+        return sync_category(
+            val[0], paged_path, entity_path, manifest['categories'].get(key), max_workers
+            )
+
+    changes = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(SWAPI)) as executor:
+        for key, (category, counts) in zip(SWAPI, executor.map(sync_key, SWAPI)):
+            manifest['categories'][key] = category
+            changes[key] = counts
+    write_json(manifest_path, manifest)
+
+    return changes
+
+
+def sync_category(uri, paged_path, entity_path, manifest=None, max_workers=MAX_WORKERS):
+    """Brings the paged and entity snapshot files of one category up to date. The category
+    manifest records the url and ETag of every page and the 'edited' timestamp of every entity
+    as of the previous sync. Each page is requested conditionally, so an unchanged page costs
+    a bodiless 304 response and is reused from the paged file. The entity timestamps are then
+    compared with the manifest: only if an entity was added, edited or removed (or the pages
+    moved) are the two files rewritten, from the reused and downloaded pages; otherwise they
+    are left untouched. Servers that send no ETags are handled too, since every page is then
+    downloaded but the files are still only rewritten on change.
+
+    Parameters:
+        uri (str): a url that specifies the resource.
+        paged_path (str): paged snapshot file path (swapi_< category >_paged.json)
+        entity_path (str): entity snapshot file path (swapi_< category >.json)
+        manifest (dict): category manifest returned by the previous sync, or None
+        max_workers (int): maximum number of pages requested ahead
+
+    Returns:
+        tuple: (category manifest, {'downloaded': ..., 'added': ..., 'edited': ...,
+               'removed': ...} counts of pages and entities)
+    """
+
+    manifest = manifest or {'pages': [], 'entities': {}}
+    known = {}
+    if manifest['pages'] and os.path.exists(paged_path) and os.path.exists(entity_path):
+        with open(paged_path, 'r', encoding='utf8') as file_obj:
+            pages = json.load(file_obj)
+        if len(pages) == len(manifest['pages']):
+            known = {url: (etag, page) for (url, etag), page in zip(manifest['pages'], pages)}
+
+    page_versions = []
+    entities = {}
+    downloaded = 0
+    with JsonSink(paged_path) as page_sink, JsonSink(entity_path) as record_sink:
+        for url, page, etag, modified in iter_page_versions(uri, known, max_workers):
+            page_versions.append([url, etag])
+            downloaded += modified
+            page_sink.write(page)
+            for record in page['results']:
+                record_sink.write(record)
+                entities[record['url']] = record.get('edited')
+
+        previous = manifest['entities'] if known else {}
+        changes = {
+            'downloaded': downloaded,
+            'added': len([url for url in entities if url not in previous]),
+            'edited': len([
+                url for url, edited in entities.items()
+                if url in previous and previous[url] != edited
+            ]),
+            'removed': len([url for url in previous if url not in entities])
+        }
+        unchanged = not (changes['added'] or changes['edited'] or changes['removed'])
+        if known and unchanged and [url for url, etag in page_versions] == list(known):
+            page_sink.abort() # leave the files untouched
+            record_sink.abort()
+
+    logging.info("{} {} pages ({} downloaded), {} added, {} edited, {} removed".format(
+        uri, len(page_versions), downloaded, changes['added'], changes['edited'],
+        changes['removed']
+        ))
+
+    return {'pages': page_versions, 'entities': entities}, changes
+
+
 def write_json(path, data):
     """Write dictionary to JSON file. The built-in open() function optional parameter
     value encoding='utf-8-sig' also works.
@@ -127,9 +644,35 @@ def write_json(path, data):
         json.dump(data, file_obj, ensure_ascii=False, indent=2)
 
 
+def write_json_stream(path, items):
+    """Write items to a JSON file as they are produced (e.g., by < iter_records() >), so that
+    only one item at a time is held in memory (see < JsonSink >). Files ending in .jsonl or
+    .ndjson receive one compact JSON document per line (NDJSON); any other file receives a
+    JSON array formatted exactly as < write_json() > would format the list of items. The
+    previous file is left intact if producing the items fails.
+
+    Parameters:
+        path (str): the file path.
+        items (iterable): the items to be encoded as JSON and written to the file.
+
+    Returns:
+        int: number of items written
+    """
+
+    with JsonSink(path) as sink:
+        for item in items:
+            sink.write(item)
+
+    return sink.count
+
+
 def main():
     """Entry point to program. Retrieve all swapi_x data.  Write out as
-    JSON to file named after the categories.
+    JSON to file named after the categories. Usage:
+
+        python swapi_data.py
+        python swapi_data.py --sync
+        python swapi_data.py --rate 20 --concurrency 32
 
     Parameters:
         None
@@ -141,21 +684,33 @@ def main():
     # Setting logging format and default level
     logging.basicConfig(format='%(levelname)s: %(message)s', level=logging.INFO)
 
-    # Get swapi_x paged data
-    logging.info("START: get paged data")
-    for val in SWAPI.values():
-        records = get_records_recursively(val[0], [], True)
-        path = os.path.join(FILE_PATH, OUTPUT_DIR, val[1])  # Windows friendly
-        write_json(path, records)
-    logging.info("END: get paged data")
-
-    # Get swapi_x entity data
-    logging.info("START: get entity data")
-    for val in SWAPI.values():
-        records = get_records_recursively(val[0], [])
-        path = os.path.join(FILE_PATH, OUTPUT_DIR, val[2])  # Windows friendly
-        write_json(path, records)
-    logging.info("END: get entity data")
+    parser = argparse.ArgumentParser(description='Write SWAPI snapshot files')
+    parser.add_argument(
+        '--sync', action='store_true',
+        help=f"update the files incrementally using {MANIFEST_NAME} (created if missing)"
+        )
+    parser.add_argument(
+        '--rate', type=float, default=RATE, help='requests per second (0 = no rate limit)'
+        )
+    parser.add_argument(
+        '--concurrency', type=int, default=MAX_CONCURRENCY, help='maximum requests in flight'
+        )
+    args = parser.parse_args()
+
+    # All categories share one rate limit and one adaptive concurrency limit
+    throttle = configure_throttle(args.rate or None, max_concurrency=args.concurrency)
+
+    if args.sync:
+        logging.info("START: sync paged and entity data")
+        sync()
+        logging.info("END: sync paged and entity data")
+    else:
+        # Get swapi_x paged and entity data in a single crawl per category, in parallel
+        logging.info("START: get paged and entity data")
+        crawl_categories()
+        logging.info("END: get paged and entity data")
+
+    logging.info("Requests: {}".format(throttle.stats()))
 
 
 if __name__ == '__main__':
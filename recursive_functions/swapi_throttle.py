@@ -0,0 +1,242 @@
+import threading
+import time
+
+BACKOFF = 0.5 # multiplicative decrease factor applied to the concurrency limit
+INITIAL_CONCURRENCY = 4
+MIN_CONCURRENCY = 1
+MAX_CONCURRENCY = 16
+OVERLOAD_STATUSES = (429, 500, 502, 503, 504) # responses that signal an overloaded API
+RETRIES = 3 # retries per request after an overload response
+RETRY_DELAY = 0.5 # first retry delay in seconds when no Retry-After header is sent (doubles)
+TARGET_LATENCY = 2.0 # seconds; slower responses are treated as a sign of overload
+
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter. Tokens accrue at < rate > per second up to
+    < burst >; each request takes one, waiting for it if the bucket is empty. All threads share
+    the bucket, so the request rate is bounded globally however many threads issue requests.
+
+    Attributes:
+        rate (float): tokens (requests) per second
+        burst (int): bucket capacity (requests that may be sent at once after a pause)
+
+    Methods:
+        acquire: take a token, waiting if required
+        pause: hold back every request for a number of seconds (e.g., per Retry-After)
+    """
+
+    def __init__(self, rate, burst=None):
+        """Initialize a TokenBucket instance. The bucket starts full."""
+
+        self.rate = rate
+        self.burst = burst or max(1, int(rate))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        """Add the tokens accrued since the last update. Caller must hold the lock."""
+
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self):
+        """Take a token, sleeping until one is available.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+
+            time.sleep(wait)
+
+    def pause(self, seconds):
+        """Empty the bucket so that no token is available for < seconds >.
+
+        Parameters:
+            seconds (float): pause duration
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, -seconds * self.rate)
+
+
+class AimdLimiter:
+    """Adaptive concurrency limit (additive increase, multiplicative decrease, as in TCP
+    congestion control). Every request holds a slot while in flight. Each success grows the
+    limit by 1 / limit, i.e., by about one slot per round of requests; an overload signal (an
+    error status or a response slower than < target_latency >) multiplies it by < backoff >, at
+    most once per round trip so that a burst of failures from one round counts once.
+
+    Attributes:
+        limit (float): current concurrency limit (requests in flight is at most int(limit))
+        min_limit (int): lower bound of the limit
+        max_limit (int): upper bound of the limit
+        target_latency (float): latency in seconds above which a response signals overload
+        backoff (float): multiplicative decrease factor
+
+    Methods:
+        acquire: take a slot, waiting while the limit is reached
+        release: return a slot and adjust the limit
+    """
+
+    def __init__(self, limit=INITIAL_CONCURRENCY, min_limit=MIN_CONCURRENCY,
+                 max_limit=MAX_CONCURRENCY, target_latency=TARGET_LATENCY, backoff=BACKOFF):
+        """Initialize an AimdLimiter instance."""
+
+        self.limit = float(limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.target_latency = target_latency
+        self.backoff = backoff
+        self._in_flight = 0
+        self._decreased_at = 0.0
+        self._condition = threading.Condition()
+
+    def acquire(self):
+        """Take a slot, waiting while < int(limit) > requests are in flight.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+
+        with self._condition:
+            while self._in_flight >= int(self.limit):
+                self._condition.wait()
+            self._in_flight += 1
+
+    def release(self, latency, overloaded=False):
+        """Return a slot and adjust the limit.
+
+        Parameters:
+            latency (float): request latency in seconds
+            overloaded (bool): the response signalled overload (e.g., 429 or 503)
+
+        Returns:
+            None
+        """
+
+        with self._condition:
+            self._in_flight -= 1
+            now = time.monotonic()
+            if overloaded or latency > self.target_latency:
+                if now - self._decreased_at >= latency:
+                    self.limit = max(self.min_limit, self.limit * self.backoff)
+                    self._decreased_at = now
+            else:
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            self._condition.notify_all()
+
+
+class Throttle:
+    """Sends requests under a global rate limit (< TokenBucket >) and an adaptive concurrency
+    limit (< AimdLimiter >). Responses with an overload status are retried, after the delay
+    given by their Retry-After header (which also pauses every other request) or an
+    exponential backoff.
+
+    Attributes:
+        bucket (TokenBucket): rate limiter (None = no rate limit)
+        limiter (AimdLimiter): concurrency limiter
+        retries (int): retries per request after an overload response
+
+    Methods:
+        call: send a request through the limiters
+        stats: return request counters and the current concurrency limit
+    """
+
+    def __init__(self, bucket=None, limiter=None, retries=RETRIES):
+        """Initialize a Throttle instance."""
+
+        self.bucket = bucket
+        self.limiter = limiter or AimdLimiter()
+        self.retries = retries
+        self._counters = {'requests': 0, 'overloaded': 0, 'retries': 0}
+        self._lock = threading.Lock()
+
+    def call(self, func, *args, **kwargs):
+        """Call a request function (e.g., < session.get >) once a token and a slot are
+        available, retrying overload responses.
+
+        Parameters:
+            func (function): callable returning a < requests.Response >
+            args (tuple): positional arguments passed to func
+            kwargs (dict): keyword arguments passed to func
+
+        Returns:
+            requests.Response: the response (the last one if every retry was overloaded)
+        """
+
+        for attempt in range(self.retries + 1):
+            if self.bucket:
+                self.bucket.acquire()
+            self.limiter.acquire()
+            start = time.monotonic()
+            try:
+                response = func(*args, **kwargs)
+            except BaseException:
+                self.limiter.release(time.monotonic() - start, overloaded=True)
+                raise
+
+            overloaded = response.status_code in OVERLOAD_STATUSES
+            self.limiter.release(time.monotonic() - start, overloaded)
+            with self._lock:
+                self._counters['requests'] += 1
+                self._counters['overloaded'] += overloaded
+                self._counters['retries'] += overloaded and attempt < self.retries
+
+            if not overloaded or attempt == self.retries:
+                return response
+
+            delay = retry_after(response)
+            if delay is not None and self.bucket:
+                self.bucket.pause(delay)
+            time.sleep(delay if delay is not None else RETRY_DELAY * 2 ** attempt)
+
+    def stats(self):
+        """Return request counters and the current concurrency limit.
+
+        Parameters:
+            None
+
+        Returns:
+            dict: {'requests': ..., 'overloaded': ..., 'retries': ..., 'limit': ...}
+        """
+
+        with self._lock:
+            stats = dict(self._counters)
+        stats['limit'] = round(self.limiter.limit, 1)
+
+        return stats
+
+
+def retry_after(response):
+    """Returns the delay requested by a response's Retry-After header (delay in seconds form).
+
+    Parameters:
+        response (requests.Response): response
+
+    Returns:
+        float: seconds to wait or None if not sent or not a number
+    """
+
+    try:
+        return max(0.0, float(response.headers['Retry-After']))
+    except (KeyError, TypeError, ValueError):
+        return None
@@ -0,0 +1,105 @@
+import json
+import os
+import sys
+
+import pytest
+
+FILE_PATH = os.path.dirname(os.path.abspath(__file__))  # Windows friendly
+CACHING_PATH = os.path.join(FILE_PATH, '..', 'caching')
+DATA_DIR = os.path.join(FILE_PATH, '..', 'recursive_functions', 'swapi_data')
+
+sys.path.insert(0, os.path.abspath(CACHING_PATH))
+
+import swapi_compact
+import swapi_solution
+
+
+def read_records(category):
+    """Return the entities of a swapi_< category >.json snapshot file."""
+
+    with open(os.path.join(DATA_DIR, f"swapi_{category}.json"), 'r', encoding='utf-8') as file_obj:
+        return json.load(file_obj)
+
+
+def read_droids():
+    """Return the Wookieepedia droid records, each given a url (they have none)."""
+
+    filepath = os.path.join(CACHING_PATH, 'wookieepedia_droids.json')
+    with open(filepath, 'r', encoding='utf-8') as file_obj:
+        droids = json.load(file_obj)
+
+    return [
+        dict(droid, url=f"https://swapi.py4e.com/api/droids/{i}/")
+        for i, droid in enumerate(droids, 1)
+    ]
+
+
+def create_all(module):
+    """Run every bulk factory with the classes defined in < module >."""
+
+    planets = swapi_solution.create_planets(read_records('planets'), cls=module.Planet)
+    species = swapi_solution.create_species_list(read_records('species'), cls=module.Species)
+
+    return {
+        'droids': swapi_solution.create_droids(read_droids(), cls=module.Droid),
+        'people': swapi_solution.create_people(
+            read_records('people'), planets, species, cls=module.Person
+            ),
+        'planets': planets,
+        'species': species,
+        'starships': swapi_solution.create_starships(
+            read_records('starships'), cls=module.Starship
+            )
+    }
+
+
+def test_compact_classes_match_regular_classes():
+    regular = create_all(swapi_solution)
+    compact = create_all(swapi_compact)
+
+    for category, entities in regular.items():
+        assert len(compact[category]) == len(entities) > 0
+        for entity, compact_entity in zip(entities, compact[category]):
+            assert type(compact_entity).__name__ == type(entity).__name__
+            assert compact_entity.jsonable() == entity.jsonable()
+
+
+@pytest.mark.parametrize('category, create, create_bulk', [
+    ('planets', swapi_solution.create_planet, swapi_solution.create_planets),
+    ('species', swapi_solution.create_species, swapi_solution.create_species_list),
+    ('starships', swapi_solution.create_starship, swapi_solution.create_starships)
+])
+def test_bulk_factories_match_per_record_factories(category, create, create_bulk):
+    for record in read_records(category):
+        try:
+            entity = create(record)
+        except ValueError:
+            continue # placeholder, see test_bulk_factories_convert_placeholders_to_none
+        assert create_bulk([record])[0].jsonable() == entity.jsonable()
+
+
+def test_bulk_factories_convert_placeholders_to_none():
+    record = dict(read_records('planets')[0], population='unknown', diameter_km='1,000')
+
+    with pytest.raises(ValueError):
+        swapi_solution.create_planet(record)
+
+    planet = swapi_solution.create_planets([record])[0]
+    assert planet.population is None
+    assert planet.diameter_km == 1000
+
+
+def test_lazy_fields_are_left_unset_without_a_descriptor():
+    record = next(record for record in read_records('starships') if record['pilots'])
+
+    starship = swapi_solution.create_starships([record], cls=swapi_compact.Starship)[0]
+    assert starship.pilots is None
+    starship = swapi_solution.create_starships([record])[0]
+    assert starship._pilots.args == (record['pilots'],) # unresolved; no request issued
+
+
+def test_schema_fields_must_name_attributes():
+    schema = {'args': ('url', 'name'), 'fields': {'rotation_period': int}}
+
+    with pytest.raises(ValueError):
+        swapi_solution.compile_factory(swapi_compact.Planet, schema)